@@ -0,0 +1,73 @@
+import argparse
+import sys
+import time
+
+from .io_utils import carregar_compacto
+from .lote import ALGORITMOS
+from .servico import ServicoConsultas, criar_servidor_http, criar_servidor_unix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m biblioteca",
+        description="Responde consultas de caminho mínimo sem interface gráfica, com o grafo carregado uma única vez.",
+    )
+    parser.add_argument("grafo", help="arquivo do grafo (JSON/YAML/CSV/NDJSON ou snapshot .grafo)")
+    parser.add_argument("-c", "--consultas", default="-",
+                        help="arquivo JSON lines com {\"inicio\", \"objetivo\"[, \"algoritmo\", \"peso\", \"id\"]} "
+                             "(padrão: entrada padrão)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON lines de saída (padrão: saída padrão)")
+    parser.add_argument("-a", "--algoritmo", default="ucs", choices=list(ALGORITMOS))
+    parser.add_argument("--peso", type=float, default=None, help="peso da heurística (A* ponderado)")
+    parser.add_argument("--landmarks", type=int, default=0,
+                        help="usa ALT com K marcos quando o arquivo não tem heurística")
+    parser.add_argument("--cache", type=int, default=128, help="árvores de caminhos mantidas em cache (UCS)")
+    parser.add_argument("--sem-cache", action="store_true", help="resolve cada consulta UCS do zero")
+    parser.add_argument("--servidor", choices=["http", "unix"], help="mantém o grafo carregado e atende clientes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--socket", default="/tmp/biblioteca.sock", help="caminho do socket Unix")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    grafo, heuristica, _ = carregar_compacto(args.grafo)
+    if not heuristica and args.landmarks > 0:
+        from .landmarks import carregar_ou_construir
+        heuristica = carregar_ou_construir(args.grafo, grafo, args.landmarks)
+    servico = ServicoConsultas(grafo, heuristica, args.algoritmo, args.peso, max(1, args.cache),
+                               usar_cache=not args.sem_cache)
+    print(f"{grafo.num_nos} nós, {grafo.num_arestas} arestas carregados em {time.perf_counter() - t0:.3f}s",
+          file=sys.stderr)
+
+    if args.servidor:
+        if args.servidor == "http":
+            servidor = criar_servidor_http(servico, args.host, args.porta)
+            endereco = f"http://{args.host}:{servidor.server_address[1]}"
+        else:
+            servidor = criar_servidor_unix(servico, args.socket)
+            endereco = args.socket
+        print(f"Atendendo em {endereco} (Ctrl+C para encerrar)", file=sys.stderr)
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            servidor.server_close()
+        return
+
+    entrada = sys.stdin if args.consultas == "-" else open(args.consultas, "r", encoding="utf-8")
+    saida = sys.stdout if not args.saida else open(args.saida, "w", encoding="utf-8")
+    try:
+        for linha in servico.responder_linhas(entrada):
+            saida.write(linha + "\n")
+            if saida is sys.stdout:
+                saida.flush()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
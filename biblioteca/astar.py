@@ -1,99 +1,161 @@
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 import heapq
 import time
 
-from .search_base import AlgoritmoBusca
+from .grafo_compacto import GrafoCompacto, buscar_compacto
+from .filas import criar_fila, escolher_fila
+from .heuristicas import funcao_heuristica
+from .observadores import trilha_de
+from .search_base import AlgoritmoBusca, funcao_vizinhos, reconstruir_caminho
 
 
-def _h(heuristica: Dict[str, Dict[str, float]], objetivo: str, no: str) -> float:
+def _h(heuristica, objetivo: str, no: str) -> float:
     if not heuristica:
         return 0.0
-    return float(heuristica.get(objetivo, {}).get(no, 0.0))
+    if hasattr(heuristica, "get"):
+        return float(heuristica.get(objetivo, {}).get(no, 0.0))
+    return float(heuristica(objetivo, no))
 
 
 class BuscaAEstrela(AlgoritmoBusca):
-    def __init__(self, peso: float = 1.0):
+    def __init__(self, peso: float = 1.0, fila: str = "auto", observador=None):
+        super().__init__(observador)
         self.peso = float(peso)
+        self.fila = fila
 
     def resolver(self, grafo, inicio, objetivo, **kwargs):
         heuristica = kwargs.get("heuristica", {})
         peso = float(kwargs.get("peso", self.peso))
-        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica, peso)
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica, peso,
+                                                               registrar_trilha=False)
         return caminho, custo, segundos
 
-    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica, peso=1.0):
+    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica, peso=1.0, registrar_trilha: bool = True):
+        obs, registro = self._preparar_observador(registrar_trilha)
+        tipo_fila = escolher_fila(grafo, self.fila, monotona=not heuristica)
+        if isinstance(grafo, GrafoCompacto):
+            return buscar_compacto(grafo, inicio, objetivo, 1.0, peso, heuristica, obs, registro, tipo_fila)
+
         t0 = time.perf_counter()
-        fronteira: List[Tuple[float, float, str, List[str]]] = []
+        h = funcao_heuristica(heuristica, objetivo)
+        vizinhos = funcao_vizinhos(grafo)
+        fronteira = criar_fila(tipo_fila, grafo)
+        inserir, remover = fronteira.inserir, fronteira.remover
         g_melhor = {inicio: 0.0}
-        f0 = 0.0 + peso * _h(heuristica, objetivo, inicio)
-        heapq.heappush(fronteira, (f0, 0.0, inicio, [inicio]))
+        pai = {inicio: None}
+        f0 = 0.0 + peso * h(inicio)
+        inserir((f0, 0.0, inicio))
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+            obs.ao_inserir(inicio, f0)
 
         visitados = set()
-        expandidos: List[str] = []
-        arestas_exploradas: List[Tuple[str, str]] = []
 
-        while fronteira:
-            f_atual, g_atual, no, caminho = heapq.heappop(fronteira)
+        while True:
+            try:
+                f_atual, g_atual, no = remover()
+            except IndexError:
+                break
+            if obs is not None:
+                obs.ao_remover(no, f_atual)
             if no in visitados:
+                if obs is not None:
+                    obs.ao_descartar(no)
                 continue
             visitados.add(no)
-            expandidos.append(no)
+            if obs is not None:
+                obs.ao_expandir(no)
 
             if no == objetivo:
-                trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": caminho}
-                return caminho, float(g_atual), float(time.perf_counter() - t0), trilha
+                caminho = reconstruir_caminho(pai, no)
+                if obs is not None:
+                    obs.ao_encontrar(no, g_atual)
+                    obs.ao_terminar()
+                return caminho, float(g_atual), float(time.perf_counter() - t0), trilha_de(registro, caminho)
 
-            for viz, passo in grafo.get(no, {}).items():
+            for viz, passo in vizinhos(no):
                 g_novo = g_atual + float(passo)
                 if viz not in g_melhor or g_novo < g_melhor[viz]:
                     g_melhor[viz] = g_novo
-                    f_novo = g_novo + peso * _h(heuristica, objetivo, viz)
-                    heapq.heappush(fronteira, (f_novo, g_novo, viz, caminho + [viz]))
-                    arestas_exploradas.append((no, viz))
+                    if obs is not None:
+                        obs.ao_relaxar(no, viz, g_novo)
+                    if viz in visitados:
+                        continue
+                    pai[viz] = no
+                    f_novo = g_novo + peso * h(viz)
+                    inserir((f_novo, g_novo, viz))
+                    if obs is not None:
+                        obs.ao_inserir(viz, f_novo)
 
-        trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": []}
-        return [], float('inf'), float(time.perf_counter() - t0), trilha
+        if obs is not None:
+            obs.ao_terminar()
+        return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
 
 
 class BuscaAEstrelaPonderada(BuscaAEstrela):
-    def __init__(self, peso: float = 1.5):
-        super().__init__(peso=peso)
+    def __init__(self, peso: float = 1.5, fila: str = "auto", observador=None):
+        super().__init__(peso=peso, fila=fila, observador=observador)
 
 
 class BuscaGulosa(AlgoritmoBusca):
    
     def resolver(self, grafo, inicio, objetivo, **kwargs):
         heuristica = kwargs.get("heuristica", {})
-        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica)
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica,
+                                                               registrar_trilha=False)
         return caminho, custo, segundos
 
-    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica):
+    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica, registrar_trilha: bool = True):
+        obs, registro = self._preparar_observador(registrar_trilha)
+        if isinstance(grafo, GrafoCompacto):
+            return buscar_compacto(grafo, inicio, objetivo, 0.0, 1.0, heuristica, obs, registro)
+
         t0 = time.perf_counter()
-        fronteira: List[Tuple[float, float, str, List[str]]] = []
-        heapq.heappush(fronteira, (_h(heuristica, objetivo, inicio), 0.0, inicio, [inicio]))
+        h = funcao_heuristica(heuristica, objetivo)
+        vizinhos = funcao_vizinhos(grafo)
+        fronteira: List[Tuple[float, float, str]] = []
+        h0 = h(inicio)
+        heapq.heappush(fronteira, (h0, 0.0, inicio))
         melhor_g = {inicio: 0.0}
+        pai = {inicio: None}
         visitados = set()
-
-        expandidos: List[str] = []
-        arestas_exploradas: List[Tuple[str, str]] = []
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+            obs.ao_inserir(inicio, h0)
 
         while fronteira:
-            h_atual, g_atual, no, caminho = heapq.heappop(fronteira)
+            h_atual, g_atual, no = heapq.heappop(fronteira)
+            if obs is not None:
+                obs.ao_remover(no, h_atual)
             if no in visitados:
+                if obs is not None:
+                    obs.ao_descartar(no)
                 continue
             visitados.add(no)
-            expandidos.append(no)
+            if obs is not None:
+                obs.ao_expandir(no)
 
             if no == objetivo:
-                trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": caminho}
-                return caminho, float(g_atual), float(time.perf_counter() - t0), trilha
+                caminho = reconstruir_caminho(pai, no)
+                if obs is not None:
+                    obs.ao_encontrar(no, g_atual)
+                    obs.ao_terminar()
+                return caminho, float(g_atual), float(time.perf_counter() - t0), trilha_de(registro, caminho)
 
-            for viz, passo in grafo.get(no, {}).items():
+            for viz, passo in vizinhos(no):
                 g_novo = g_atual + float(passo)
                 if viz not in melhor_g or g_novo < melhor_g[viz]:
                     melhor_g[viz] = g_novo
-                    heapq.heappush(fronteira, (_h(heuristica, objetivo, viz), g_novo, viz, caminho + [viz]))
-                    arestas_exploradas.append((no, viz))
-
-        trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": []}
-        return [], float('inf'), float(time.perf_counter() - t0), trilha
+                    if obs is not None:
+                        obs.ao_relaxar(no, viz, g_novo)
+                    if viz in visitados:
+                        continue
+                    pai[viz] = no
+                    h_viz = h(viz)
+                    heapq.heappush(fronteira, (h_viz, g_novo, viz))
+                    if obs is not None:
+                        obs.ao_inserir(viz, h_viz)
+
+        if obs is not None:
+            obs.ao_terminar()
+        return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
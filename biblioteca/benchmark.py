@@ -0,0 +1,213 @@
+from typing import Any, Dict, Iterable, List, Tuple
+import argparse
+import csv
+import itertools
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from .grafo_compacto import ConstrutorGrafo, GrafoCompacto
+from .heuristicas import HeuristicaCoordenadas
+from .lote import ALGORITMOS, criar_algoritmo
+from .observadores import Contadores
+
+
+Coordenadas = Dict[str, Tuple[float, float]]
+
+
+def gerar_grade(n: int, obstaculos: float = 0.2, semente: int = 0) -> Tuple[GrafoCompacto, Coordenadas]:
+    rng = random.Random(semente)
+    lado = max(2, int(math.isqrt(n)))
+    livre = [[rng.random() >= obstaculos for _ in range(lado)] for _ in range(lado)]
+    construtor = ConstrutorGrafo()
+    coords: Coordenadas = {}
+    for y in range(lado):
+        for x in range(lado):
+            if not livre[y][x]:
+                continue
+            no = f"{x},{y}"
+            coords[no] = (float(x), float(y))
+            construtor.adicionar_no(no)
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                vx, vy = x + dx, y + dy
+                if 0 <= vx < lado and 0 <= vy < lado and livre[vy][vx]:
+                    construtor.adicionar_aresta(no, f"{vx},{vy}", 1.0)
+    return construtor.finalizar(), coords
+
+
+def gerar_geometrico(n: int, grau_medio: float = 6.0, semente: int = 0) -> Tuple[GrafoCompacto, Coordenadas]:
+    rng = random.Random(semente)
+    pontos = [(rng.random(), rng.random()) for _ in range(n)]
+    raio = math.sqrt(grau_medio / (math.pi * max(1, n)))
+    celulas: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(pontos):
+        celulas.setdefault((int(x / raio), int(y / raio)), []).append(i)
+
+    construtor = ConstrutorGrafo()
+    coords: Coordenadas = {}
+    for i, (x, y) in enumerate(pontos):
+        coords[str(i)] = (x, y)
+        construtor.adicionar_no(str(i))
+    for i, (x, y) in enumerate(pontos):
+        cx, cy = int(x / raio), int(y / raio)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in celulas.get((cx + dx, cy + dy), ()):
+                    if j == i:
+                        continue
+                    d = math.hypot(x - pontos[j][0], y - pontos[j][1])
+                    if d <= raio:
+                        construtor.adicionar_aresta(str(i), str(j), d)
+    return construtor.finalizar(), coords
+
+
+def gerar_livre_de_escala(n: int, m: int = 3, semente: int = 0) -> Tuple[GrafoCompacto, None]:
+    rng = random.Random(semente)
+    construtor = ConstrutorGrafo()
+    extremos: List[int] = []
+    m = max(1, m)
+    for i in range(min(n, m + 1)):
+        construtor.adicionar_no(str(i))
+        for j in range(i):
+            c = float(rng.randint(1, 100))
+            construtor.adicionar_aresta(str(i), str(j), c)
+            construtor.adicionar_aresta(str(j), str(i), c)
+            extremos.extend((i, j))
+    for i in range(m + 1, n):
+        alvos = set()
+        while len(alvos) < m:
+            alvos.add(rng.choice(extremos))
+        for j in alvos:
+            c = float(rng.randint(1, 100))
+            construtor.adicionar_aresta(str(i), str(j), c)
+            construtor.adicionar_aresta(str(j), str(i), c)
+            extremos.extend((i, j))
+    return construtor.finalizar(), None
+
+
+GERADORES = {
+    "grade": gerar_grade,
+    "geometrico": gerar_geometrico,
+    "livre_de_escala": gerar_livre_de_escala,
+}
+
+
+REPRESENTACOES = ("dict", "compacto")
+
+
+def _executar(algoritmo, grafo, inicio, objetivo, heuristica):
+    # resolver() é comum a todos os algoritmos; os que não usam heurística ignoram o argumento
+    return algoritmo.resolver(grafo, inicio, objetivo, heuristica=heuristica)
+
+
+def executar_benchmark(
+    geradores: Iterable[str] = ("grade", "geometrico", "livre_de_escala"),
+    tamanhos: Iterable[int] = (1000, 10000),
+    algoritmos: Iterable[str] = ("ucs", "astar", "astar_ponderado", "gulosa"),
+    consultas: int = 20,
+    semente: int = 0,
+    peso: float = 1.5,
+    medir_memoria: bool = True,
+    representacoes: Iterable[str] = REPRESENTACOES,
+) -> List[Dict[str, Any]]:
+    linhas: List[Dict[str, Any]] = []
+    for nome_gerador in geradores:
+        for n in tamanhos:
+            t0 = time.perf_counter()
+            compacto, coords = GERADORES[nome_gerador](n, semente=semente)
+            segundos_geracao = time.perf_counter() - t0
+
+            rng = random.Random(semente + 1)
+            nomes = compacto.nomes
+            pares = [(rng.choice(nomes), rng.choice(nomes)) for _ in range(consultas)]
+            heuristica = HeuristicaCoordenadas(coords) if coords else {}
+            otimos = [criar_algoritmo("ucs").resolver(compacto, s, t)[1] for s, t in pares]
+
+            grafos = {r: compacto.para_dict() if r == "dict" else compacto for r in representacoes}
+
+            for representacao, nome in itertools.product(grafos, algoritmos):
+                grafo = grafos[representacao]
+                algoritmo = criar_algoritmo(nome, peso if nome == "astar_ponderado" else None)
+                contadores = Contadores()
+                tempos, expandidos, insercoes, descartes, razoes = [], [], [], [], []
+                pico = 0
+                for (s, t), otimo in zip(pares, otimos):
+                    algoritmo.observador = None
+                    _, custo, segundos = _executar(algoritmo, grafo, s, t, heuristica)
+                    tempos.append(segundos)
+                    algoritmo.observador = contadores
+                    _executar(algoritmo, grafo, s, t, heuristica)
+                    algoritmo.observador = None
+                    expandidos.append(contadores.expansoes)
+                    insercoes.append(contadores.insercoes)
+                    descartes.append(contadores.descartes)
+                    if math.isfinite(custo) and math.isfinite(otimo) and otimo > 0:
+                        razoes.append(custo / otimo)
+                    if medir_memoria:
+                        tracemalloc.start()
+                        _executar(algoritmo, grafo, s, t, heuristica)
+                        pico = max(pico, tracemalloc.get_traced_memory()[1])
+                        tracemalloc.stop()
+
+                linhas.append({
+                    "gerador": nome_gerador,
+                    "nos": compacto.num_nos,
+                    "arestas": compacto.num_arestas,
+                    "segundos_geracao": round(segundos_geracao, 6),
+                    "representacao": representacao,
+                    "algoritmo": nome,
+                    "consultas": len(pares),
+                    "tempo_total_s": round(sum(tempos), 6),
+                    "tempo_medio_s": round(sum(tempos) / len(tempos), 6) if tempos else 0.0,
+                    "expandidos_medio": round(sum(expandidos) / len(expandidos), 2) if expandidos else 0.0,
+                    "insercoes_medio": round(sum(insercoes) / len(insercoes), 2) if insercoes else 0.0,
+                    "descartes_medio": round(sum(descartes) / len(descartes), 2) if descartes else 0.0,
+                    "pico_memoria_bytes": pico if medir_memoria else None,
+                    "razao_custo_media": round(sum(razoes) / len(razoes), 6) if razoes else None,
+                    "razao_custo_max": round(max(razoes), 6) if razoes else None,
+                })
+    return linhas
+
+
+def escrever(linhas: List[Dict[str, Any]], formato: str, saida=None):
+    destino = open(saida, "w", encoding="utf-8", newline="") if saida else sys.stdout
+    try:
+        if formato == "csv":
+            if linhas:
+                escritor = csv.DictWriter(destino, fieldnames=list(linhas[0].keys()))
+                escritor.writeheader()
+                escritor.writerows(linhas)
+        else:
+            json.dump(linhas, destino, indent=2, ensure_ascii=False)
+            destino.write("\n")
+    finally:
+        if saida:
+            destino.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de busca em grafos sintéticos.")
+    parser.add_argument("--geradores", nargs="+", default=list(GERADORES), choices=list(GERADORES))
+    parser.add_argument("--tamanhos", nargs="+", type=int, default=[1000, 10000])
+    parser.add_argument("--algoritmos", nargs="+", default=["ucs", "astar", "astar_ponderado", "gulosa"],
+                        choices=list(ALGORITMOS))
+    parser.add_argument("--representacao", nargs="+", default=list(REPRESENTACOES), choices=list(REPRESENTACOES),
+                        help="motor medido: dict de dicts, GrafoCompacto ou ambos")
+    parser.add_argument("--consultas", type=int, default=20)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--peso", type=float, default=1.5, help="peso do A* ponderado")
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--formato", choices=["json", "csv"], default="json")
+    parser.add_argument("--saida", default=None)
+    args = parser.parse_args(argv)
+
+    linhas = executar_benchmark(args.geradores, args.tamanhos, args.algoritmos, args.consultas,
+                                args.semente, args.peso, not args.sem_memoria, args.representacao)
+    escrever(linhas, args.formato, args.saida)
+
+
+if __name__ == "__main__":
+    main()
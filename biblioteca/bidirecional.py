@@ -0,0 +1,155 @@
+from typing import Dict, List, Tuple
+import heapq
+import math
+import time
+
+from .grafo_compacto import GrafoCompacto
+from .heuristicas import funcao_heuristica
+from .observadores import ObservadorComNomes, trilha_de
+from .search_base import AlgoritmoBusca, reconstruir_caminho
+
+
+def inverter(grafo: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    rev: Dict[str, Dict[str, float]] = {no: {} for no in grafo}
+    for u, viz in grafo.items():
+        for v, c in viz.items():
+            rev.setdefault(v, {})[u] = float(c)
+    return rev
+
+
+class BuscaBidirecionalCustoUniforme(AlgoritmoBusca):
+    def resolver(self, grafo, inicio, objetivo, **kwargs):
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, registrar_trilha=False)
+        return caminho, custo, segundos
+
+    def resolver_com_trilha(self, grafo, inicio, objetivo, registrar_trilha: bool = True):
+        return self._buscar(grafo, inicio, objetivo, None, registrar_trilha)
+
+    def _buscar(self, grafo, inicio, objetivo, heuristica, registrar_trilha):
+        t0 = time.perf_counter()
+        obs, registro = self._preparar_observador(registrar_trilha)
+        if isinstance(grafo, GrafoCompacto):
+            if inicio not in grafo.indice or objetivo not in grafo.indice:
+                return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
+            nomes = grafo.nomes
+            if obs is not None:
+                obs = ObservadorComNomes(obs, nomes)
+            s, t = grafo.indice[inicio], grafo.indice[objetivo]
+            lados = (grafo.arestas, grafo.reverso().arestas)
+        elif hasattr(grafo, "vizinhos"):
+            antecessores = getattr(grafo, "antecessores", None)
+            if antecessores is None:
+                raise ValueError("Busca bidirecional em grafo implícito requer o método antecessores(no).")
+            nomes = None
+            s, t = inicio, objetivo
+            lados = (grafo.vizinhos, antecessores)
+        else:
+            nomes = None
+            s, t = inicio, objetivo
+            rev = self._memo_por_grafo(grafo, "reverso", inverter)
+            lados = (lambda no: grafo.get(no, {}).items(), lambda no: rev.get(no, {}).items())
+
+        potencial = None
+        if heuristica:
+            memo: Dict = {}
+            h_ida = funcao_heuristica(heuristica, objetivo)
+            h_volta = self._limite_reverso(heuristica, inicio)
+
+            def potencial(no):
+                p = memo.get(no)
+                if p is None:
+                    nome = nomes[no] if nomes is not None else no
+                    p = 0.5 * (h_ida(nome) - h_volta(nome))
+                    memo[no] = p
+                return p
+
+        dist = ({s: 0.0}, {t: 0.0})
+        pai = ({s: None}, {t: None})
+        fechado = (set(), set())
+        p_s = potencial(s) if potencial else 0.0
+        p_t = potencial(t) if potencial else 0.0
+        filas: Tuple[List, List] = ([(p_s, 0.0, s)], [(-p_t, 0.0, t)])
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+            obs.ao_inserir(s, p_s)
+            obs.ao_inserir(t, -p_t)
+
+        mu = 0.0 if s == t else math.inf
+        encontro = s if s == t else None
+
+        while filas[0] and filas[1]:
+            if filas[0][0][0] + filas[1][0][0] >= mu:
+                break
+            lado = 0 if len(filas[0]) <= len(filas[1]) else 1
+            outro = 1 - lado
+            chave_u, d, u = heapq.heappop(filas[lado])
+            if obs is not None:
+                obs.ao_remover(u, chave_u)
+            if u in fechado[lado]:
+                if obs is not None:
+                    obs.ao_descartar(u)
+                continue
+            fechado[lado].add(u)
+            if obs is not None:
+                obs.ao_expandir(u)
+
+            dist_l, dist_o, pai_l = dist[lado], dist[outro], pai[lado]
+            for v, passo in lados[lado](u):
+                d_novo = d + float(passo)
+                if v not in dist_l or d_novo < dist_l[v]:
+                    dist_l[v] = d_novo
+                    pai_l[v] = u
+                    chave = d_novo
+                    if potencial:
+                        chave += potencial(v) if lado == 0 else -potencial(v)
+                    heapq.heappush(filas[lado], (chave, d_novo, v))
+                    if obs is not None:
+                        if lado == 0:
+                            obs.ao_relaxar(u, v, d_novo)
+                        else:
+                            obs.ao_relaxar(v, u, d_novo)
+                        obs.ao_inserir(v, chave)
+                if v in dist_o and dist_l[v] + dist_o[v] < mu:
+                    mu = dist_l[v] + dist_o[v]
+                    encontro = v
+
+        if encontro is None:
+            caminho = []
+        else:
+            caminho = reconstruir_caminho(pai[0], encontro)
+            no = pai[1][encontro]
+            while no is not None:
+                caminho.append(no)
+                no = pai[1][no]
+        if nomes is not None:
+            caminho = [nomes[i] for i in caminho]
+        if obs is not None:
+            if caminho:
+                obs.ao_encontrar(t, mu)
+            obs.ao_terminar()
+        return caminho, float(mu), float(time.perf_counter() - t0), trilha_de(registro, caminho)
+
+
+    def _limite_reverso(self, heuristica, inicio):
+        # a busca reversa precisa de um limite inferior para d(inicio, no), não para d(no, inicio)
+        if hasattr(heuristica, "origem"):
+            tabela = heuristica.origem(inicio)
+            return lambda no: float(tabela.get(no, 0.0))
+        if getattr(self, "simetrico", False):
+            return funcao_heuristica(heuristica, inicio)
+        return lambda no: 0.0
+
+
+class BuscaBidirecionalAEstrela(BuscaBidirecionalCustoUniforme):
+    def __init__(self, simetrico: bool = False, observador=None):
+        super().__init__(observador)
+        self.simetrico = simetrico
+
+    def resolver(self, grafo, inicio, objetivo, **kwargs):
+        heuristica = kwargs.get("heuristica", {})
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica,
+                                                               registrar_trilha=False)
+        return caminho, custo, segundos
+
+    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica=None, registrar_trilha: bool = True):
+        return self._buscar(grafo, inicio, objetivo, heuristica, registrar_trilha)
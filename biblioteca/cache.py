@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+import hashlib
+import threading
+import time
+
+from .grafo_compacto import GrafoCompacto
+from .ucs import ArvoreCaminhos, BuscaCustoUniforme
+
+
+def impressao_digital(grafo) -> str:
+    if isinstance(grafo, GrafoCompacto):
+        if grafo._impressao is not None:
+            return grafo._impressao
+        h = hashlib.sha1()
+        h.update("\n".join(grafo.nomes).encode("utf-8"))
+        for arr in (grafo.offsets, grafo.alvos, grafo.pesos):
+            h.update(memoryview(arr).cast("B"))
+        grafo._impressao = h.hexdigest()
+        return grafo._impressao
+
+    return impressao_digital(GrafoCompacto.de_dict(grafo))
+
+
+class CacheArvores:
+    ALGORITMOS = {"ucs": BuscaCustoUniforme}
+
+    def __init__(self, capacidade: int = 128):
+        if capacidade < 1:
+            raise ValueError("Capacidade do cache deve ser >= 1.")
+        self.capacidade = int(capacidade)
+        self._arvores: "OrderedDict[Tuple[str, str, float, str], ArvoreCaminhos]" = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def _impressao_de(self, grafo) -> str:
+        # só o GrafoCompacto é imutável; um dict editado no lugar manteria a impressão e as árvores antigas
+        if not isinstance(grafo, GrafoCompacto):
+            raise ValueError("CacheArvores requer um GrafoCompacto. Use compilar(grafo) antes de consultar.")
+        return impressao_digital(grafo)
+
+    def arvore(self, grafo, inicio: str, algoritmo: str = "ucs", peso: float = 1.0) -> ArvoreCaminhos:
+        if algoritmo not in self.ALGORITMOS:
+            raise ValueError(f"Árvore de caminhos indisponível para {algoritmo}. Opções: {', '.join(self.ALGORITMOS)}")
+        with self._trava:
+            chave = (self._impressao_de(grafo), algoritmo, float(peso), inicio)
+            arvore = self._arvores.get(chave)
+            if arvore is not None:
+                self._arvores.move_to_end(chave)
+                self.acertos += 1
+                return arvore
+            self.falhas += 1
+
+        # a árvore é calculada fora da trava para não bloquear acertos de outras threads
+        arvore = self.ALGORITMOS[algoritmo]().arvore(grafo, inicio)
+        with self._trava:
+            self._arvores[chave] = arvore
+            self._arvores.move_to_end(chave)
+            if len(self._arvores) > self.capacidade:
+                self._arvores.popitem(last=False)
+                self.remocoes += 1
+        return arvore
+
+    def resolver(self, grafo, inicio: str, objetivo: str, algoritmo: str = "ucs",
+                 peso: float = 1.0) -> Tuple[List[str], float, float]:
+        t0 = time.perf_counter()
+        arvore = self.arvore(grafo, inicio, algoritmo, peso)
+        return arvore.caminho(objetivo), arvore.custo(objetivo), float(time.perf_counter() - t0)
+
+    def invalidar(self, grafo=None):
+        with self._trava:
+            if grafo is None:
+                self._arvores.clear()
+                return
+            impressao = self._impressao_de(grafo)
+            for chave in [c for c in self._arvores if c[0] == impressao]:
+                del self._arvores[chave]
+
+    def estatisticas(self) -> Dict[str, Any]:
+        with self._trava:
+            total = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "remocoes": self.remocoes,
+                "tamanho": len(self._arvores),
+                "capacidade": self.capacidade,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._arvores)
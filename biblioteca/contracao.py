@@ -0,0 +1,298 @@
+from array import array
+from typing import Dict, List, Tuple
+import argparse
+import heapq
+import json
+import math
+import os
+import time
+
+from .grafo_compacto import GrafoCompacto, compilar
+from .observadores import ObservadorComNomes, trilha_de
+from .search_base import AlgoritmoBusca
+
+
+LIMITE_TESTEMUNHA = 500
+
+
+def _testemunha(saida: List[Dict[int, float]], contraido: bytearray, u: int, x: int,
+                alvos: Dict[int, float], limite: float) -> Dict[int, float]:
+    dist = {u: 0.0}
+    fronteira = [(0.0, u)]
+    restantes = set(alvos)
+    assentados = 0
+    while fronteira and restantes and assentados < LIMITE_TESTEMUNHA:
+        d, a = heapq.heappop(fronteira)
+        if d > dist.get(a, math.inf):
+            continue
+        if d > limite:
+            break
+        assentados += 1
+        restantes.discard(a)
+        for b, w in saida[a].items():
+            if b == x or contraido[b]:
+                continue
+            d_novo = d + w
+            if d_novo < dist.get(b, math.inf):
+                dist[b] = d_novo
+                heapq.heappush(fronteira, (d_novo, b))
+    return dist
+
+
+def _atalhos(saida, entrada, contraido, x: int) -> List[Tuple[int, int, float]]:
+    novos = []
+    vizinhos_saida = {w: c for w, c in saida[x].items() if not contraido[w]}
+    if not vizinhos_saida:
+        return novos
+    for u, c_ux in entrada[x].items():
+        if contraido[u]:
+            continue
+        alvos = {w: c_ux + c_xw for w, c_xw in vizinhos_saida.items() if w != u}
+        if not alvos:
+            continue
+        dist = _testemunha(saida, contraido, u, x, alvos, max(alvos.values()))
+        for w, via_x in alvos.items():
+            if dist.get(w, math.inf) > via_x:
+                novos.append((u, w, via_x))
+    return novos
+
+
+def _prioridade(saida, entrada, contraido, vizinhos_contraidos, x: int) -> int:
+    grau = sum(1 for w in saida[x] if not contraido[w]) + sum(1 for u in entrada[x] if not contraido[u])
+    return len(_atalhos(saida, entrada, contraido, x)) - grau + vizinhos_contraidos[x]
+
+
+class HierarquiaContracao:
+    def __init__(self, nomes: List[str], rank, cima: GrafoCompacto, baixo: GrafoCompacto,
+                 meio: Dict[Tuple[int, int], int], estatisticas: Dict[str, float] = None):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = cima.indice
+        self.rank = rank
+        self.cima = cima
+        self.baixo = baixo
+        self.meio = meio
+        self.estatisticas = estatisticas or {}
+
+    @classmethod
+    def construir(cls, grafo) -> "HierarquiaContracao":
+        t0 = time.perf_counter()
+        g = compilar(grafo)
+        n = g.num_nos
+        saida: List[Dict[int, float]] = [{} for _ in range(n)]
+        entrada: List[Dict[int, float]] = [{} for _ in range(n)]
+        for u in range(n):
+            for v, c in g.arestas(u):
+                if u != v and c < saida[u].get(v, math.inf):
+                    saida[u][v] = c
+                    entrada[v][u] = c
+
+        contraido = bytearray(n)
+        vizinhos_contraidos = [0] * n
+        meio: Dict[Tuple[int, int], int] = {}
+        rank = array("i", [0]) * n
+        fila = [(_prioridade(saida, entrada, contraido, vizinhos_contraidos, x), x) for x in range(n)]
+        heapq.heapify(fila)
+
+        proximo = 0
+        while fila:
+            _, x = heapq.heappop(fila)
+            # ordenação preguiçosa: recalcula e devolve à fila se deixou de ser o menor
+            p = _prioridade(saida, entrada, contraido, vizinhos_contraidos, x)
+            if fila and p > fila[0][0]:
+                heapq.heappush(fila, (p, x))
+                continue
+
+            for u, w, c in _atalhos(saida, entrada, contraido, x):
+                if c < saida[u].get(w, math.inf):
+                    saida[u][w] = c
+                    entrada[w][u] = c
+                    meio[(u, w)] = x
+            contraido[x] = 1
+            rank[x] = proximo
+            proximo += 1
+            for v in set(saida[x]) | set(entrada[x]):
+                vizinhos_contraidos[v] += 1
+
+        arestas_cima = [(u, v, c) for u in range(n) for v, c in saida[u].items() if rank[v] > rank[u]]
+        arestas_baixo = [(v, u, c) for u in range(n) for v, c in saida[u].items() if rank[u] > rank[v]]
+        cima = _csr(g.nomes, g.indice, n, arestas_cima)
+        baixo = _csr(g.nomes, g.indice, n, arestas_baixo)
+        estatisticas = {
+            "segundos_preprocessamento": time.perf_counter() - t0,
+            "nos": n,
+            "arestas_originais": g.num_arestas,
+            "atalhos": len(meio),
+            "arestas_indice": len(arestas_cima) + len(arestas_baixo),
+        }
+        return cls(g.nomes, rank, cima, baixo, meio, estatisticas)
+
+    def salvar(self, caminho: str) -> int:
+        def _arestas(h: GrafoCompacto):
+            return [[u, v, c] for u in range(len(self.nomes)) for v, c in h.arestas(u)]
+        data = {
+            "nomes": self.nomes,
+            "rank": self.rank.tolist(),
+            "cima": _arestas(self.cima),
+            "baixo": _arestas(self.baixo),
+            "meio": [[u, v, x] for (u, v), x in self.meio.items()],
+            "estatisticas": self.estatisticas,
+        }
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tamanho = os.path.getsize(caminho)
+        self.estatisticas["bytes_indice"] = tamanho
+        return tamanho
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "HierarquiaContracao":
+        with open(caminho, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        nomes = data["nomes"]
+        indice = {no: i for i, no in enumerate(nomes)}
+        n = len(nomes)
+        cima = _csr(nomes, indice, n, data["cima"])
+        baixo = _csr(nomes, indice, n, data["baixo"])
+        meio = {(u, v): x for u, v, x in data["meio"]}
+        estatisticas = dict(data.get("estatisticas", {}))
+        estatisticas["bytes_indice"] = os.path.getsize(caminho)
+        return cls(nomes, array("i", data["rank"]), cima, baixo, meio, estatisticas)
+
+    def desempacotar(self, u: int, v: int) -> List[int]:
+        nos = [u]
+        pilha = [(u, v)]
+        while pilha:
+            a, b = pilha.pop()
+            x = self.meio.get((a, b))
+            if x is None:
+                nos.append(b)
+            else:
+                pilha.append((x, b))
+                pilha.append((a, x))
+        return nos
+
+
+def _csr(nomes, indice, n: int, arestas) -> GrafoCompacto:
+    arestas = sorted(arestas, key=lambda a: a[0])
+    offsets = array("q", [0]) * (n + 1)
+    for u, _, _ in arestas:
+        offsets[u + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    alvos = array("i", (v for _, v, _ in arestas))
+    pesos = array("d", (float(c) for _, _, c in arestas))
+    return GrafoCompacto(nomes, offsets, alvos, pesos, indice)
+
+
+class BuscaHierarquiaContracao(AlgoritmoBusca):
+    def __init__(self, hierarquia: HierarquiaContracao, observador=None):
+        super().__init__(observador)
+        self.hierarquia = hierarquia
+
+    def resolver(self, grafo, inicio, objetivo, **kwargs):
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, registrar_trilha=False)
+        return caminho, custo, segundos
+
+    def resolver_com_trilha(self, grafo, inicio, objetivo, registrar_trilha: bool = True):
+        t0 = time.perf_counter()
+        ch = self.hierarquia
+        nomes = ch.nomes
+        obs, registro = self._preparar_observador(registrar_trilha)
+        if inicio not in ch.indice or objetivo not in ch.indice:
+            return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
+        if obs is not None:
+            obs = ObservadorComNomes(obs, nomes)
+
+        s, t = ch.indice[inicio], ch.indice[objetivo]
+        lados = (ch.cima, ch.baixo)
+        dist = ({s: 0.0}, {t: 0.0})
+        pai = ({s: -1}, {t: -1})
+        fechado = (set(), set())
+        filas = ([(0.0, s)], [(0.0, t)])
+        mu = 0.0 if s == t else math.inf
+        encontro = s if s == t else -1
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+            obs.ao_inserir(s, 0.0)
+            obs.ao_inserir(t, 0.0)
+
+        while filas[0] or filas[1]:
+            ativos = [lado for lado in (0, 1) if filas[lado] and filas[lado][0][0] < mu]
+            if not ativos:
+                break
+            lado = min(ativos, key=lambda l: filas[l][0][0])
+            d, u = heapq.heappop(filas[lado])
+            if obs is not None:
+                obs.ao_remover(u, d)
+            if u in fechado[lado]:
+                if obs is not None:
+                    obs.ao_descartar(u)
+                continue
+            fechado[lado].add(u)
+            if obs is not None:
+                obs.ao_expandir(u)
+            outro = dist[1 - lado]
+            if u in outro and d + outro[u] < mu:
+                mu = d + outro[u]
+                encontro = u
+            dist_l, pai_l = dist[lado], pai[lado]
+            for v, c in lados[lado].arestas(u):
+                d_novo = d + c
+                if d_novo < dist_l.get(v, math.inf):
+                    dist_l[v] = d_novo
+                    pai_l[v] = u
+                    heapq.heappush(filas[lado], (d_novo, v))
+                    if obs is not None:
+                        if lado == 0:
+                            obs.ao_relaxar(u, v, d_novo)
+                        else:
+                            obs.ao_relaxar(v, u, d_novo)
+                        obs.ao_inserir(v, d_novo)
+                    if v in outro and d_novo + outro[v] < mu:
+                        mu = d_novo + outro[v]
+                        encontro = v
+
+        caminho: List[str] = []
+        if encontro != -1:
+            subida = []
+            v = encontro
+            while v != -1:
+                subida.append(v)
+                v = pai[0][v]
+            subida.reverse()
+            v = pai[1][encontro]
+            while v != -1:
+                subida.append(v)
+                v = pai[1][v]
+            ids = [subida[0]]
+            for a, b in zip(subida, subida[1:]):
+                ids.extend(ch.desempacotar(a, b)[1:])
+            caminho = [nomes[i] for i in ids]
+
+        if obs is not None:
+            if caminho:
+                obs.ao_encontrar(t, mu)
+            obs.ao_terminar()
+        return caminho, float(mu), float(time.perf_counter() - t0), trilha_de(registro, caminho)
+
+
+def main(argv=None):
+    from .io_utils import carregar_com_heuristica
+
+    parser = argparse.ArgumentParser(description="Pré-processa uma hierarquia de contração (CH) do grafo.")
+    parser.add_argument("grafo", help="arquivo JSON/YAML do grafo")
+    parser.add_argument("--saida", default=None, help="arquivo do índice (padrão: <grafo>.ch.json)")
+    args = parser.parse_args(argv)
+
+    grafo, _, _ = carregar_com_heuristica(args.grafo)
+    ch = HierarquiaContracao.construir(grafo)
+    saida = args.saida or args.grafo + ".ch.json"
+    tamanho = ch.salvar(saida)
+    est = ch.estatisticas
+    print(
+        f"Nós: {est['nos']} | Arestas: {est['arestas_originais']} | Atalhos: {est['atalhos']} | "
+        f"Pré-processamento (s): {est['segundos_preprocessamento']:.3f} | Índice: {tamanho} bytes -> {saida}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+
+
+LIMITE_BALDES = 4096
+
+
+class FilaHeap:
+    def __init__(self):
+        self._heap: List[Tuple[float, float, Any]] = []
+        self.inserir = partial(heapq.heappush, self._heap)
+        self.remover = partial(heapq.heappop, self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class HeapIndexado:
+    def __init__(self):
+        self._heap: List[list] = []
+        self._pos: Dict[Any, int] = {}
+
+    def inserir(self, entrada: Tuple[float, float, Any]):
+        prioridade, desempate, no = entrada
+        i = self._pos.get(no)
+        if i is None:
+            self._heap.append([prioridade, desempate, no])
+            i = len(self._heap) - 1
+            self._pos[no] = i
+            self._subir(i)
+        elif (prioridade, desempate) < (self._heap[i][0], self._heap[i][1]):
+            self._heap[i][0] = prioridade
+            self._heap[i][1] = desempate
+            self._subir(i)
+
+    def remover(self) -> Tuple[float, float, Any]:
+        heap = self._heap
+        if not heap:
+            raise IndexError("remover de fila vazia")
+        topo = heap[0]
+        ultimo = heap.pop()
+        del self._pos[topo[2]]
+        if heap:
+            heap[0] = ultimo
+            self._pos[ultimo[2]] = 0
+            self._descer(0)
+        return topo[0], topo[1], topo[2]
+
+    def descartar(self, no) -> bool:
+        i = self._pos.pop(no, None)
+        if i is None:
+            return False
+        heap = self._heap
+        ultimo = heap.pop()
+        if i < len(heap):
+            heap[i] = ultimo
+            self._pos[ultimo[2]] = i
+            self._subir(i)
+            self._descer(self._pos[ultimo[2]])
+        return True
+
+    def topo(self) -> Tuple[float, float, Any]:
+        return self._heap[0][0], self._heap[0][1], self._heap[0][2]
+
+    def prioridade(self, no) -> Optional[float]:
+        i = self._pos.get(no)
+        return None if i is None else self._heap[i][0]
+
+    def __contains__(self, no) -> bool:
+        return no in self._pos
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _subir(self, i: int):
+        heap, pos = self._heap, self._pos
+        item = heap[i]
+        chave = (item[0], item[1])
+        while i > 0:
+            p = (i - 1) >> 1
+            pai = heap[p]
+            if chave >= (pai[0], pai[1]):
+                break
+            heap[i] = pai
+            pos[pai[2]] = i
+            i = p
+        heap[i] = item
+        pos[item[2]] = i
+
+    def _descer(self, i: int):
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        item = heap[i]
+        chave = (item[0], item[1])
+        while True:
+            f = 2 * i + 1
+            if f >= n:
+                break
+            if f + 1 < n and (heap[f + 1][0], heap[f + 1][1]) < (heap[f][0], heap[f][1]):
+                f += 1
+            if (heap[f][0], heap[f][1]) >= chave:
+                break
+            heap[i] = heap[f]
+            pos[heap[i][2]] = i
+            i = f
+        heap[i] = item
+        pos[item[2]] = i
+
+
+class FilaBaldes:
+    def __init__(self, peso_maximo: int):
+        self.largura = int(peso_maximo) + 1
+        self._baldes: List[List[Tuple[float, float, Any]]] = [[] for _ in range(self.largura)]
+        self._onde: Dict[Any, Tuple[Tuple[float, float, Any], bool]] = {}
+        # prioridades fracionárias ou fora da janela vão para um heap comum
+        self._extra: List[Tuple[float, float, Any]] = []
+        self._cursor = 0
+        self._nos_baldes = 0
+
+    def inserir(self, entrada: Tuple[float, float, Any]):
+        prioridade, no = entrada[0], entrada[2]
+        atual = self._onde.get(no)
+        if atual is not None:
+            if prioridade >= atual[0][0]:
+                return
+            if atual[1]:
+                self._nos_baldes -= 1
+        p = int(prioridade)
+        if p == prioridade and self._cursor <= p < self._cursor + self.largura:
+            self._baldes[p % self.largura].append(entrada)
+            self._nos_baldes += 1
+            self._onde[no] = (entrada, True)
+        else:
+            heapq.heappush(self._extra, entrada)
+            self._onde[no] = (entrada, False)
+
+    def _valida(self, entrada) -> bool:
+        atual = self._onde.get(entrada[2])
+        return atual is not None and atual[0] is entrada
+
+    def remover(self) -> Tuple[float, float, Any]:
+        baldes, largura, extra = self._baldes, self.largura, self._extra
+        balde = None
+        while self._nos_baldes:
+            balde = baldes[self._cursor % largura]
+            while balde and not self._valida(balde[-1]):
+                balde.pop()
+            if balde:
+                break
+            self._cursor += 1
+        while extra and not self._valida(extra[0]):
+            heapq.heappop(extra)
+        if self._nos_baldes and (not extra or self._cursor <= extra[0][0]):
+            entrada = balde.pop()
+            self._nos_baldes -= 1
+        elif extra:
+            entrada = heapq.heappop(extra)
+        else:
+            raise IndexError("remover de fila vazia")
+        del self._onde[entrada[2]]
+        return entrada
+
+    def __len__(self) -> int:
+        return len(self._onde)
+
+
+def perfil_pesos(grafo) -> Optional[Dict[str, Any]]:
+    if hasattr(grafo, "perfil_pesos"):
+        return grafo.perfil_pesos()
+    if isinstance(grafo, dict):
+        # dicts podem ser editados no lugar: o perfil é recalculado a cada chamada (só com fila="baldes")
+        pesos = [float(c) for viz in grafo.values() for c in viz.values()]
+        return _perfil(pesos, len(grafo), len(pesos))
+    if not hasattr(grafo, "pesos"):
+        # grafo implícito só com vizinhos(no): o perfil dos pesos é desconhecido
+        return None
+    perfil = grafo._perfil
+    if perfil is None:
+        perfil = grafo._perfil = _perfil(grafo.pesos, grafo.num_nos, grafo.num_arestas)
+    return perfil
+
+
+def _perfil(pesos, n: int, m: int) -> Dict[str, Any]:
+    return {
+        "inteiros": all(float(c).is_integer() for c in pesos),
+        "minimo": min(pesos) if m else 0.0,
+        "maximo": max(pesos) if m else 0.0,
+        "grau_medio": m / n if n else 0.0,
+    }
+
+
+def escolher_fila(grafo, tipo: str = "auto", monotona: bool = True) -> str:
+    if tipo != "auto":
+        return tipo
+    # perfilar um dict custa O(E) por consulta; no modo automático ele fica sempre com o heap
+    if not monotona or isinstance(grafo, dict):
+        return "heap"
+    perfil = perfil_pesos(grafo)
+    if perfil is not None and perfil["inteiros"] and perfil["minimo"] >= 0 and perfil["maximo"] <= LIMITE_BALDES:
+        return "baldes"
+    # o HeapIndexado insere menos, mas em Python puro perde para o heapq (em C) mesmo em grafos densos
+    return "heap"
+
+
+def criar_fila(tipo: str, grafo=None):
+    if tipo == "heap":
+        return FilaHeap()
+    if tipo == "indexado":
+        return HeapIndexado()
+    if tipo == "baldes":
+        perfil = perfil_pesos(grafo) if grafo is not None else None
+        return FilaBaldes(int(perfil["maximo"]) if perfil is not None else LIMITE_BALDES)
+    raise ValueError(f"Fila desconhecida: {tipo}. Use 'auto', 'heap', 'indexado' ou 'baldes'.")
@@ -0,0 +1,316 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+import math
+import time
+
+from .heuristicas import METRICAS, RAIZ2, funcao_heuristica
+from .observadores import trilha_de
+from .search_base import AlgoritmoBusca, reconstruir_caminho
+
+
+Celula = Tuple[int, int]
+
+PASSAVEIS = ".GS"
+
+
+class GradeImplicita:
+    def __init__(self, largura: int, altura: int, livre: Optional[bytearray] = None, diagonal: bool = True):
+        self.largura = int(largura)
+        self.altura = int(altura)
+        self.livre = livre if livre is not None else bytearray(b"\x01") * (self.largura * self.altura)
+        if len(self.livre) != self.largura * self.altura:
+            raise ValueError("Bitmap da grade não corresponde a largura x altura.")
+        self.diagonal = diagonal
+        self._transposta: Optional[bytearray] = None
+
+    @classmethod
+    def de_linhas(cls, linhas: Iterable[str], passaveis: str = PASSAVEIS, diagonal: bool = True) -> "GradeImplicita":
+        linhas = [linha.rstrip("\r\n") for linha in linhas]
+        largura = max((len(linha) for linha in linhas), default=0)
+        livre = bytearray(largura * len(linhas))
+        for y, linha in enumerate(linhas):
+            base = y * largura
+            for x, c in enumerate(linha):
+                if c in passaveis:
+                    livre[base + x] = 1
+        return cls(largura, len(linhas), livre, diagonal)
+
+    @classmethod
+    def carregar_map(cls, caminho: str, diagonal: bool = True) -> "GradeImplicita":
+        # formato Moving AI: cabeçalho (type/height/width), linha "map" e depois as linhas da grade
+        with open(caminho, "r", encoding="utf-8") as f:
+            cabecalho: Dict[str, str] = {}
+            for linha in f:
+                partes = linha.split()
+                if not partes:
+                    continue
+                if partes[0].lower() == "map":
+                    break
+                cabecalho[partes[0].lower()] = partes[1] if len(partes) > 1 else ""
+            else:
+                raise ValueError("Arquivo .map sem a linha 'map'.")
+            try:
+                altura, largura = int(cabecalho["height"]), int(cabecalho["width"])
+            except (KeyError, ValueError):
+                raise ValueError("Cabeçalho .map inválido: informe height e width.") from None
+            linhas = [linha for _, linha in zip(range(altura), f)]
+        if len(linhas) != altura:
+            raise ValueError(f"Arquivo .map com {len(linhas)} linhas; esperado {altura}.")
+        grade = cls.de_linhas(linhas, diagonal=diagonal)
+        if grade.largura != largura:
+            raise ValueError(f"Arquivo .map com largura {grade.largura}; esperado {largura}.")
+        return grade
+
+    @property
+    def num_livres(self) -> int:
+        return self.livre.count(1)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.livre)
+
+    def passavel(self, x: int, y: int) -> bool:
+        return 0 <= x < self.largura and 0 <= y < self.altura and self.livre[y * self.largura + x] == 1
+
+    def bloquear(self, x: int, y: int, bloqueado: bool = True):
+        self.livre[y * self.largura + x] = 0 if bloqueado else 1
+        self._transposta = None
+
+    def transposta(self) -> bytearray:
+        # bitmap coluna a coluna, para varrer saltos verticais com bytearray.find
+        if self._transposta is None:
+            largura, livre = self.largura, self.livre
+            self._transposta = bytearray().join(livre[x::largura] for x in range(largura))
+        return self._transposta
+
+    def __contains__(self, no) -> bool:
+        try:
+            x, y = no
+        except (TypeError, ValueError):
+            return False
+        return self.passavel(x, y)
+
+    def vizinhos(self, no: Celula) -> List[Tuple[Celula, float]]:
+        x, y = no
+        if not self.passavel(x, y):
+            return []
+        largura, livre = self.largura, self.livre
+        i = y * largura + x
+        n = y > 0 and livre[i - largura]
+        s = y < self.altura - 1 and livre[i + largura]
+        o = x > 0 and livre[i - 1]
+        l = x < largura - 1 and livre[i + 1]
+        saida = []
+        if n:
+            saida.append(((x, y - 1), 1.0))
+        if s:
+            saida.append(((x, y + 1), 1.0))
+        if o:
+            saida.append(((x - 1, y), 1.0))
+        if l:
+            saida.append(((x + 1, y), 1.0))
+        if self.diagonal:
+            # sem cortar cantos: a diagonal exige as duas células ortogonais livres
+            if n and o and livre[i - largura - 1]:
+                saida.append(((x - 1, y - 1), RAIZ2))
+            if n and l and livre[i - largura + 1]:
+                saida.append(((x + 1, y - 1), RAIZ2))
+            if s and o and livre[i + largura - 1]:
+                saida.append(((x - 1, y + 1), RAIZ2))
+            if s and l and livre[i + largura + 1]:
+                saida.append(((x + 1, y + 1), RAIZ2))
+        return saida
+
+    antecessores = vizinhos
+
+    def perfil_pesos(self) -> Dict[str, Any]:
+        return {
+            "inteiros": not self.diagonal,
+            "minimo": 1.0,
+            "maximo": RAIZ2 if self.diagonal else 1.0,
+            "grau_medio": 8.0 if self.diagonal else 4.0,
+        }
+
+    def heuristica(self):
+        distancia = METRICAS["octil" if self.diagonal else "manhattan"]
+        return lambda objetivo, no: distancia(no, objetivo)
+
+
+def _sinal(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+def _expandir_caminho(pontos: List[Celula]) -> List[Celula]:
+    if not pontos:
+        return []
+    caminho = [pontos[0]]
+    for (x0, y0), (x1, y1) in zip(pontos, pontos[1:]):
+        dx, dy = _sinal(x1 - x0), _sinal(y1 - y0)
+        x, y = x0, y0
+        while (x, y) != (x1, y1):
+            x += dx
+            y += dy
+            caminho.append((x, y))
+    return caminho
+
+
+def _varrer(bitmap: bytearray, linha: int, n: int, linhas: int, pos: int, d: int, alvo: int) -> int:
+    # salto reto numa linha do bitmap: primeiro vizinho forçado, o alvo ou -1 ao bater num obstáculo
+    base = linha * n
+    if d > 0:
+        fim = bitmap.find(0, base + pos, base + n)
+        fim = n if fim < 0 else fim - base
+        achado = alvo if pos <= alvo < fim else fim
+        for lado in (linha - 1, linha + 1):
+            if 0 <= lado < linhas:
+                b = lado * n
+                i = bitmap.find(b"\x00\x01", b + pos - 1, b + achado + (achado < fim))
+                if i >= 0 and i + 1 - b < achado:
+                    achado = i + 1 - b
+        return achado if achado < fim else -1
+    fim = bitmap.rfind(0, base, base + pos + 1)
+    fim = -1 if fim < 0 else fim - base
+    achado = alvo if fim < alvo <= pos else fim
+    for lado in (linha - 1, linha + 1):
+        if 0 <= lado < linhas:
+            b = lado * n
+            i = bitmap.rfind(b"\x01\x00", b + max(achado, 0), b + pos + 2)
+            if i >= 0 and i - b > achado:
+                achado = i - b
+    return achado if achado > fim else -1
+
+
+class BuscaJPS(AlgoritmoBusca):
+    def resolver(self, grafo, inicio, objetivo, **kwargs):
+        heuristica = kwargs.get("heuristica")
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica,
+                                                               registrar_trilha=False)
+        return caminho, custo, segundos
+
+    def _direcoes(self, grade: GradeImplicita, no: Celula, pai: Optional[Celula]) -> List[Tuple[int, int]]:
+        x, y = no
+        livre = grade.passavel
+        if pai is None:
+            return [(v[0] - x, v[1] - y) for v, _ in grade.vizinhos(no)]
+        dx, dy = _sinal(x - pai[0]), _sinal(y - pai[1])
+        direcoes = []
+        if dx and dy:
+            vertical, horizontal = livre(x, y + dy), livre(x + dx, y)
+            if vertical:
+                direcoes.append((0, dy))
+            if horizontal:
+                direcoes.append((dx, 0))
+            if vertical and horizontal:
+                direcoes.append((dx, dy))
+        elif dx:
+            frente, abaixo, acima = livre(x + dx, y), livre(x, y + 1), livre(x, y - 1)
+            if frente:
+                direcoes.append((dx, 0))
+                if abaixo:
+                    direcoes.append((dx, 1))
+                if acima:
+                    direcoes.append((dx, -1))
+            if abaixo:
+                direcoes.append((0, 1))
+            if acima:
+                direcoes.append((0, -1))
+        else:
+            frente, direita, esquerda = livre(x, y + dy), livre(x + 1, y), livre(x - 1, y)
+            if frente:
+                direcoes.append((0, dy))
+                if direita:
+                    direcoes.append((1, dy))
+                if esquerda:
+                    direcoes.append((-1, dy))
+            if direita:
+                direcoes.append((1, 0))
+            if esquerda:
+                direcoes.append((-1, 0))
+        return direcoes
+
+    def _reta(self, grade: GradeImplicita, x: int, y: int, dx: int, dy: int, alvo: Celula) -> Optional[Celula]:
+        largura, altura = grade.largura, grade.altura
+        if not (0 <= x < largura and 0 <= y < altura):
+            return None
+        if dy == 0:
+            i = _varrer(grade.livre, y, largura, altura, x, dx, alvo[0] if alvo[1] == y else -2)
+            return (i, y) if i >= 0 else None
+        i = _varrer(grade.transposta(), x, altura, largura, y, dy, alvo[1] if alvo[0] == x else -2)
+        return (x, i) if i >= 0 else None
+
+    def _saltar(self, grade: GradeImplicita, x: int, y: int, dx: int, dy: int, alvo: Celula) -> Optional[Celula]:
+        if not (dx and dy):
+            return self._reta(grade, x, y, dx, dy, alvo)
+        livre = grade.passavel
+        while True:
+            if not livre(x, y):
+                return None
+            if (x, y) == alvo:
+                return x, y
+            if self._reta(grade, x + dx, y, dx, 0, alvo) or self._reta(grade, x, y + dy, 0, dy, alvo):
+                return x, y
+            if not (livre(x + dx, y) and livre(x, y + dy)):
+                return None
+            x += dx
+            y += dy
+
+    def resolver_com_trilha(self, grafo: GradeImplicita, inicio, objetivo, heuristica=None,
+                            registrar_trilha: bool = True):
+        if not isinstance(grafo, GradeImplicita) or not grafo.diagonal:
+            raise ValueError("Jump Point Search requer uma GradeImplicita 8-conexa.")
+        t0 = time.perf_counter()
+        obs, registro = self._preparar_observador(registrar_trilha)
+        inicio, objetivo = tuple(inicio), tuple(objetivo)
+        h = funcao_heuristica(heuristica or grafo.heuristica(), objetivo)
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+        if inicio not in grafo or objetivo not in grafo:
+            if obs is not None:
+                obs.ao_terminar()
+            return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
+
+        octil = METRICAS["octil"]
+        f0 = h(inicio)
+        fronteira: List[Tuple[float, float, Celula]] = [(f0, 0.0, inicio)]
+        g_melhor = {inicio: 0.0}
+        pai: Dict[Celula, Optional[Celula]] = {inicio: None}
+        fechados = set()
+        if obs is not None:
+            obs.ao_inserir(inicio, f0)
+
+        while fronteira:
+            f_atual, g, no = heapq.heappop(fronteira)
+            if obs is not None:
+                obs.ao_remover(no, f_atual)
+            if no in fechados:
+                if obs is not None:
+                    obs.ao_descartar(no)
+                continue
+            fechados.add(no)
+            if obs is not None:
+                obs.ao_expandir(no)
+
+            if no == objetivo:
+                caminho = _expandir_caminho(reconstruir_caminho(pai, no))
+                if obs is not None:
+                    obs.ao_encontrar(no, g)
+                    obs.ao_terminar()
+                return caminho, float(g), float(time.perf_counter() - t0), trilha_de(registro, caminho)
+
+            for dx, dy in self._direcoes(grafo, no, pai[no]):
+                salto = self._saltar(grafo, no[0] + dx, no[1] + dy, dx, dy, objetivo)
+                if salto is None or salto in fechados:
+                    continue
+                g_novo = g + octil(no, salto)
+                if g_novo < g_melhor.get(salto, math.inf):
+                    g_melhor[salto] = g_novo
+                    pai[salto] = no
+                    f_novo = g_novo + h(salto)
+                    heapq.heappush(fronteira, (f_novo, g_novo, salto))
+                    if obs is not None:
+                        obs.ao_relaxar(no, salto, g_novo)
+                        obs.ao_inserir(salto, f_novo)
+
+        if obs is not None:
+            obs.ao_terminar()
+        return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
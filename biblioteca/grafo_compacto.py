@@ -0,0 +1,290 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import math
+import time
+
+from .filas import criar_fila
+from .heuristicas import funcao_heuristica
+from .observadores import ObservadorBusca, ObservadorComNomes, RegistroTrilha, trilha_de
+
+
+INF = math.inf
+
+
+class GrafoCompacto:
+    def __init__(self, nomes: List[str], offsets, alvos, pesos, indice: Dict[str, int] = None):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = indice if indice is not None else {no: i for i, no in enumerate(nomes)}
+        self.offsets = offsets
+        self.alvos = alvos
+        self.pesos = pesos
+        self._reverso = None
+        self._impressao = None
+        self._perfil = None
+        self.arquivo = None
+
+    @classmethod
+    def de_dict(cls, grafo: Dict[str, Dict[str, float]]) -> "GrafoCompacto":
+        nomes: List[str] = list(grafo.keys())
+        indice = {no: i for i, no in enumerate(nomes)}
+        for viz in grafo.values():
+            for v in viz:
+                if v not in indice:
+                    indice[v] = len(nomes)
+                    nomes.append(v)
+
+        offsets = array("q", [0])
+        alvos = array("i")
+        pesos = array("d")
+        for no in nomes:
+            for v, c in grafo.get(no, {}).items():
+                alvos.append(indice[v])
+                pesos.append(float(c))
+            offsets.append(len(alvos))
+        return cls(nomes, offsets, alvos, pesos, indice)
+
+    def __reduce__(self):
+        if self.arquivo is not None:
+            from .io_utils import abrir_snapshot
+            return abrir_snapshot, (self.arquivo,)
+        return GrafoCompacto, (self.nomes, array("q", self.offsets), array("i", self.alvos),
+                               array("d", self.pesos), self.indice)
+
+    @property
+    def num_nos(self) -> int:
+        return len(self.nomes)
+
+    @property
+    def num_arestas(self) -> int:
+        return len(self.alvos)
+
+    def __len__(self) -> int:
+        return len(self.nomes)
+
+    def __contains__(self, no) -> bool:
+        return no in self.indice
+
+    def id_de(self, no: str) -> int:
+        try:
+            return self.indice[no]
+        except KeyError:
+            raise KeyError(f"Nó inexistente no grafo: {no}") from None
+
+    def arestas(self, u: int) -> Iterable[Tuple[int, float]]:
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.alvos[a:b], self.pesos[a:b])
+
+    def reverso(self) -> "GrafoCompacto":
+        if self._reverso is None:
+            n = len(self.nomes)
+            contagem = array("q", bytes(8 * (n + 1)))
+            for v in self.alvos:
+                contagem[v + 1] += 1
+            for i in range(n):
+                contagem[i + 1] += contagem[i]
+            offsets = array("q", contagem)
+            alvos = array("i", bytes(4 * len(self.alvos)))
+            pesos = array("d", bytes(8 * len(self.pesos)))
+            for u in range(n):
+                for i in range(self.offsets[u], self.offsets[u + 1]):
+                    v = self.alvos[i]
+                    j = contagem[v]
+                    alvos[j] = u
+                    pesos[j] = self.pesos[i]
+                    contagem[v] = j + 1
+            rev = GrafoCompacto(self.nomes, offsets, alvos, pesos, self.indice)
+            rev._reverso = self
+            self._reverso = rev
+        return self._reverso
+
+    def para_dict(self) -> Dict[str, Dict[str, float]]:
+        nomes, alvos, pesos = self.nomes, self.alvos, self.pesos
+        g: Dict[str, Dict[str, float]] = {}
+        for u, no in enumerate(nomes):
+            a, b = self.offsets[u], self.offsets[u + 1]
+            g[no] = {nomes[alvos[i]]: pesos[i] for i in range(a, b)}
+        return g
+
+    def heuristica_para(self, heuristica, objetivo: str):
+        # h calculado só nos nós que a busca toca, memorizado por id durante a consulta
+        if not heuristica:
+            return None
+        estimar = funcao_heuristica(heuristica, objetivo)
+        nomes = self.nomes
+        memo: Dict[int, float] = {}
+
+        def h(v: int) -> float:
+            x = memo.get(v)
+            if x is None:
+                x = memo[v] = estimar(nomes[v])
+            return x
+        return h
+
+
+class ConstrutorGrafo:
+    def __init__(self):
+        self.nomes: List[str] = []
+        self.indice: Dict[str, int] = {}
+        self._origens = array("i")
+        self._alvos = array("i")
+        self._pesos = array("d")
+
+    def _id(self, no: str) -> int:
+        i = self.indice.get(no)
+        if i is None:
+            i = len(self.nomes)
+            self.indice[no] = i
+            self.nomes.append(no)
+        return i
+
+    def adicionar_no(self, no: str):
+        self._id(no)
+
+    def adicionar_aresta(self, origem: str, destino: str, custo: float):
+        self._origens.append(self._id(origem))
+        self._alvos.append(self._id(destino))
+        self._pesos.append(float(custo))
+
+    def finalizar(self) -> GrafoCompacto:
+        n, m = len(self.nomes), len(self._origens)
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in self._origens:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        proximo = array("q", offsets)
+        alvos = array("i", bytes(4 * m))
+        pesos = array("d", bytes(8 * m))
+        origens, origem_alvos, origem_pesos = self._origens, self._alvos, self._pesos
+        for k in range(m):
+            u = origens[k]
+            j = proximo[u]
+            alvos[j] = origem_alvos[k]
+            pesos[j] = origem_pesos[k]
+            proximo[u] = j + 1
+        self._origens = self._alvos = self._pesos = None
+        return GrafoCompacto(self.nomes, offsets, alvos, pesos, self.indice)
+
+
+def compilar(grafo) -> GrafoCompacto:
+    if isinstance(grafo, GrafoCompacto):
+        return grafo
+    return GrafoCompacto.de_dict(grafo)
+
+
+def _reconstruir(g: GrafoCompacto, pai, alvo: int) -> List[str]:
+    caminho: List[str] = []
+    v = alvo
+    while v != -1:
+        caminho.append(g.nomes[v])
+        v = pai[v]
+    caminho.reverse()
+    return caminho
+
+
+def buscar_compacto(
+    g: GrafoCompacto,
+    inicio: str,
+    objetivo: str,
+    peso_g: float = 1.0,
+    peso_h: float = 0.0,
+    heuristica=None,
+    observador: Optional[ObservadorBusca] = None,
+    registro: Optional[RegistroTrilha] = None,
+    fila: str = "heap",
+) -> Tuple[List[str], float, float, Dict[str, list]]:
+    t0 = time.perf_counter()
+    n = len(g.nomes)
+    if inicio not in g.indice:
+        return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
+    s = g.indice[inicio]
+    t = g.indice.get(objetivo, -1)
+    h = g.heuristica_para(heuristica, objetivo) if peso_h else None
+    obs = ObservadorComNomes(observador, g.nomes) if observador is not None else None
+
+    offsets, alvos, pesos = g.offsets, g.alvos, g.pesos
+    dist = array("d", [INF]) * n
+    pai = array("i", [-1]) * n
+    fechado = bytearray(n)
+
+    dist[s] = 0.0
+    f0 = peso_h * h(s) if h is not None else 0.0
+    fronteira = criar_fila(fila, g)
+    inserir, remover = fronteira.inserir, fronteira.remover
+    inserir((f0, 0.0, s))
+    if obs is not None:
+        obs.ao_iniciar(inicio, objetivo)
+        obs.ao_inserir(s, f0)
+
+    while True:
+        try:
+            f_atual, d, u = remover()
+        except IndexError:
+            break
+        if obs is not None:
+            obs.ao_remover(u, f_atual)
+        if fechado[u]:
+            if obs is not None:
+                obs.ao_descartar(u)
+            continue
+        fechado[u] = 1
+        if obs is not None:
+            obs.ao_expandir(u)
+
+        if u == t:
+            caminho = _reconstruir(g, pai, t)
+            if obs is not None:
+                obs.ao_encontrar(u, d)
+                obs.ao_terminar()
+            return caminho, float(d), float(time.perf_counter() - t0), trilha_de(registro, caminho)
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = alvos[i]
+            d_novo = d + pesos[i]
+            if d_novo < dist[v]:
+                dist[v] = d_novo
+                if obs is not None:
+                    obs.ao_relaxar(u, v, d_novo)
+                if fechado[v]:
+                    continue
+                pai[v] = u
+                f = peso_g * d_novo
+                if h is not None:
+                    f += peso_h * h(v)
+                inserir((f, d_novo, v))
+                if obs is not None:
+                    obs.ao_inserir(v, f)
+
+    if obs is not None:
+        obs.ao_terminar()
+    return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
+
+
+def arvore_compacta(g: GrafoCompacto, s: int, alvos: Iterable[int] = None):
+    n = len(g.nomes)
+    offsets, arr_alvos, pesos = g.offsets, g.alvos, g.pesos
+    dist = array("d", [INF]) * n
+    pai = array("i", [-1]) * n
+    fechado = bytearray(n)
+    restantes = set(alvos) if alvos is not None else None
+
+    dist[s] = 0.0
+    fronteira: List[Tuple[float, int]] = [(0.0, s)]
+    while fronteira:
+        d, u = heapq.heappop(fronteira)
+        if fechado[u]:
+            continue
+        fechado[u] = 1
+        if restantes is not None:
+            restantes.discard(u)
+            if not restantes:
+                break
+        for i in range(offsets[u], offsets[u + 1]):
+            v = arr_alvos[i]
+            d_novo = d + pesos[i]
+            if d_novo < dist[v]:
+                dist[v] = d_novo
+                pai[v] = u
+                heapq.heappush(fronteira, (d_novo, v))
+    return dist, pai, fechado, not fronteira
@@ -0,0 +1,132 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import math
+
+
+Coordenadas = Dict[str, Tuple[float, float]]
+
+RAIO_TERRA_KM = 6371.0088
+RAIZ2 = math.sqrt(2.0)
+
+
+def _euclidiana(a, b) -> float:
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _manhattan(a, b) -> float:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def _octil(a, b) -> float:
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    if dx < dy:
+        dx, dy = dy, dx
+    return dx + (RAIZ2 - 1.0) * dy
+
+
+def _haversine(a, b) -> float:
+    # coordenadas como (longitude, latitude) em graus; resultado em km
+    lon1, lat1, lon2, lat2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    s = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RAIO_TERRA_KM * math.asin(min(1.0, math.sqrt(s)))
+
+
+METRICAS: Dict[str, Callable[[Tuple[float, float], Tuple[float, float]], float]] = {
+    "euclidiana": _euclidiana,
+    "manhattan": _manhattan,
+    "octil": _octil,
+    "haversine": _haversine,
+}
+
+
+def ler_coordenadas(cfg: Optional[Dict[str, Any]]) -> Coordenadas:
+    coords = (cfg or {}).get("coordenadas")
+    if not isinstance(coords, dict):
+        return {}
+    out: Coordenadas = {}
+    for no, c in coords.items():
+        if isinstance(c, dict):
+            c = (c.get("x", c.get("lon")), c.get("y", c.get("lat")))
+        if isinstance(c, (list, tuple)) and len(c) >= 2 and c[0] is not None and c[1] is not None:
+            out[str(no)] = (float(c[0]), float(c[1]))
+    return out
+
+
+class _HeuristicaObjetivo:
+    def __init__(self, heuristica: "HeuristicaCoordenadas", objetivo: str):
+        self.heuristica = heuristica
+        self.alvo = heuristica.coords.get(objetivo)
+        self.memo: Optional[Dict[str, float]] = {} if heuristica.memorizar else None
+
+    def get(self, no, default=0.0) -> float:
+        if self.alvo is None:
+            return default
+        memo = self.memo
+        if memo is not None:
+            h = memo.get(no)
+            if h is not None:
+                return h
+        c = self.heuristica.coords.get(no)
+        if c is None:
+            return default
+        h = self.heuristica.escala * self.heuristica.distancia(c, self.alvo)
+        if memo is not None:
+            memo[no] = h
+        return h
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        if self.alvo is None:
+            return iter(())
+        return ((no, self.get(no)) for no in self.heuristica.coords)
+
+
+class HeuristicaCoordenadas:
+    def __init__(self, coords: Coordenadas, metrica: str = "euclidiana", escala: float = 1.0,
+                 memorizar: bool = False):
+        if metrica not in METRICAS:
+            raise ValueError(f"Métrica inválida: {metrica}. Use {', '.join(METRICAS)}.")
+        self.coords = coords
+        self.metrica = metrica
+        self.distancia = METRICAS[metrica]
+        self.escala = float(escala)
+        self.memorizar = memorizar
+        # (objetivo, tabela) num único slot: ler e trocar a tupla inteira é atômico entre threads
+        self._ultimo: Optional[Tuple[Any, _HeuristicaObjetivo]] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.coords)
+
+    def __call__(self, objetivo, no) -> float:
+        return self.get(objetivo).get(no, 0.0)
+
+    def get(self, objetivo, default=None) -> _HeuristicaObjetivo:
+        ultimo = self._ultimo
+        if ultimo is not None and ultimo[0] == objetivo:
+            return ultimo[1]
+        tabela = _HeuristicaObjetivo(self, objetivo)
+        self._ultimo = (objetivo, tabela)
+        return tabela
+
+    def origem(self, inicio) -> _HeuristicaObjetivo:
+        # métrica simétrica: a distância até o início também limita d(inicio, no)
+        return _HeuristicaObjetivo(self, inicio)
+
+
+def heuristica_de_config(cfg: Optional[Dict[str, Any]]) -> Optional[HeuristicaCoordenadas]:
+    coords = ler_coordenadas(cfg)
+    if not coords:
+        return None
+    return HeuristicaCoordenadas(
+        coords,
+        metrica=str(cfg.get("metrica", "euclidiana")),
+        escala=float(cfg.get("escala_heuristica", 1.0)),
+        memorizar=bool(cfg.get("memorizar_heuristica", False)),
+    )
+
+
+def funcao_heuristica(heuristica, objetivo) -> Callable[[Any], float]:
+    if not heuristica:
+        return lambda no: 0.0
+    if hasattr(heuristica, "get"):
+        tabela = heuristica.get(objetivo) or {}
+        return lambda no: float(tabela.get(no, 0.0))
+    return lambda no: float(heuristica(objetivo, no))
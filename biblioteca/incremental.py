@@ -0,0 +1,115 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import math
+import time
+
+from .astar import _h
+from .bidirecional import inverter
+from .filas import HeapIndexado
+from .observadores import ObservadorBusca
+
+
+INF = math.inf
+
+
+class ReplanejadorLPA:
+    def __init__(self, grafo: Dict[str, Dict[str, float]], inicio: str, objetivo: str, heuristica=None,
+                 observador: Optional[ObservadorBusca] = None):
+        self.sucessores: Dict[str, Dict[str, float]] = {u: {v: float(c) for v, c in viz.items()}
+                                                        for u, viz in grafo.items()}
+        self.predecessores = inverter(self.sucessores)
+        for no in self.predecessores:
+            self.sucessores.setdefault(no, {})
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.heuristica = heuristica or {}
+        self.observador = observador
+        self.expansoes = 0
+
+        self.g: Dict[str, float] = {}
+        self.rhs: Dict[str, float] = {inicio: 0.0}
+        self.fila = HeapIndexado()
+        self.fila.inserir(self._chave(inicio) + (inicio,))
+
+    def _chave(self, no: str) -> Tuple[float, float]:
+        m = min(self.g.get(no, INF), self.rhs.get(no, INF))
+        return m + _h(self.heuristica, self.objetivo, no), m
+
+    def _atualizar_no(self, no: str):
+        if no != self.inicio:
+            g = self.g
+            self.rhs[no] = min((g.get(p, INF) + c for p, c in self.predecessores.get(no, {}).items()), default=INF)
+        self.fila.descartar(no)
+        if self.g.get(no, INF) != self.rhs.get(no, INF):
+            chave = self._chave(no)
+            self.fila.inserir(chave + (no,))
+            if self.observador is not None:
+                self.observador.ao_inserir(no, chave[0])
+
+    def _calcular(self):
+        fila, g, rhs, obs = self.fila, self.g, self.rhs, self.observador
+        t = self.objetivo
+        while fila and ((fila.topo()[0], fila.topo()[1]) < self._chave(t) or rhs.get(t, INF) != g.get(t, INF)):
+            k1, _, u = fila.remover()
+            if obs is not None:
+                obs.ao_remover(u, k1)
+                obs.ao_expandir(u)
+            self.expansoes += 1
+            if g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                self._atualizar_no(u)
+            for v, c in self.sucessores.get(u, {}).items():
+                if obs is not None:
+                    obs.ao_relaxar(u, v, g[u] + c)
+                self._atualizar_no(v)
+
+    def _caminho(self) -> List[str]:
+        t = self.objetivo
+        if self.g.get(t, INF) == INF:
+            return []
+        caminho = [t]
+        vistos = {t}
+        no = t
+        while no != self.inicio:
+            melhor, melhor_custo = None, INF
+            for p, c in self.predecessores.get(no, {}).items():
+                custo = self.g.get(p, INF) + c
+                if custo < melhor_custo and p not in vistos:
+                    melhor, melhor_custo = p, custo
+            if melhor is None:
+                return []
+            caminho.append(melhor)
+            vistos.add(melhor)
+            no = melhor
+        caminho.reverse()
+        return caminho
+
+    def resolver(self) -> Tuple[List[str], float, float]:
+        t0 = time.perf_counter()
+        if self.observador is not None:
+            self.observador.ao_iniciar(self.inicio, self.objetivo)
+        self.expansoes = 0
+        self._calcular()
+        caminho = self._caminho()
+        custo = self.g.get(self.objetivo, INF) if caminho else INF
+        if self.observador is not None:
+            if caminho:
+                self.observador.ao_encontrar(self.objetivo, custo)
+            self.observador.ao_terminar()
+        return caminho, float(custo), float(time.perf_counter() - t0)
+
+    def atualizar_arestas(self, mudancas: Iterable[Tuple[str, str, Optional[float]]]):
+        afetados = set()
+        for u, v, custo in mudancas:
+            if custo is None or custo == INF:
+                self.sucessores.get(u, {}).pop(v, None)
+                self.predecessores.get(v, {}).pop(u, None)
+            else:
+                self.sucessores.setdefault(u, {})[v] = float(custo)
+                self.sucessores.setdefault(v, {})
+                self.predecessores.setdefault(v, {})[u] = float(custo)
+                self.predecessores.setdefault(u, {})
+            afetados.add(v)
+        for v in afetados:
+            self._atualizar_no(v)
@@ -1,6 +1,14 @@
-from typing import Dict, Any, Tuple
+from array import array
+from typing import Dict, Any, Iterator, Tuple
+import csv
 import json
+import mmap
 import os
+import struct
+import sys
+
+from .grafo_compacto import ConstrutorGrafo, GrafoCompacto, compilar
+from .heuristicas import heuristica_de_config
 
 try:
     import yaml
@@ -13,20 +21,132 @@ def carregar_com_heuristica(caminho: str) -> Tuple[Dict[str, Dict[str, float]],
     return _normalizar_tudo(data)
 
 
+def carregar_compacto(caminho: str) -> Tuple[GrafoCompacto, Dict[str, Dict[str, float]], Dict[str, Any]]:
+    _, ext = os.path.splitext(caminho.lower())
+    if ext in EXT_SNAPSHOT:
+        return abrir_snapshot(caminho), {}, {}
+    if ext in EXT_ARESTAS:
+        return carregar_arestas(caminho), {}, {}
+    grafo, heuristica, cfg = carregar_com_heuristica(caminho)
+    return compilar(grafo), heuristica, cfg
+
+
+EXT_ARESTAS = (".csv", ".ndjson", ".jsonl")
+EXT_SNAPSHOT = (".grafo",)
+
+
+def _ler_arestas(caminho: str) -> Iterator[Tuple[str, str, float]]:
+    _, ext = os.path.splitext(caminho.lower())
+    with open(caminho, "r", encoding="utf-8", newline="") as f:
+        if ext == ".csv":
+            for n_linha, linha in enumerate(csv.reader(f), 1):
+                if not linha or linha[0].startswith("#"):
+                    continue
+                if len(linha) < 3:
+                    raise ValueError(f"Linha {n_linha}: esperado origem,destino,custo.")
+                try:
+                    custo = float(linha[2])
+                except ValueError:
+                    if n_linha == 1:
+                        continue
+                    raise ValueError(f"Linha {n_linha}: custo inválido: {linha[2]}") from None
+                yield linha[0], linha[1], custo
+        else:
+            for n_linha, linha in enumerate(f, 1):
+                linha = linha.strip()
+                if not linha:
+                    continue
+                item = json.loads(linha)
+                if isinstance(item, dict):
+                    yield str(item["origem"]), str(item["destino"]), float(item["custo"])
+                elif isinstance(item, list) and len(item) >= 3:
+                    yield str(item[0]), str(item[1]), float(item[2])
+                else:
+                    raise ValueError(f"Linha {n_linha}: aresta inválida.")
+
+
+def carregar_arestas(caminho: str) -> GrafoCompacto:
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+    construtor = ConstrutorGrafo()
+    for origem, destino, custo in _ler_arestas(caminho):
+        construtor.adicionar_aresta(origem, destino, custo)
+    return construtor.finalizar()
+
+
+_MAGICO = b"GRAFOCSR"
+_VERSAO = 1
+_CABECALHO = struct.Struct("<8sIIQQQ")
+
+
+def _alinhar(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def salvar_snapshot(grafo, caminho: str):
+    g = compilar(grafo)
+    if sys.byteorder != "little":
+        raise RuntimeError("Snapshot binário só é suportado em máquinas little-endian.")
+    nomes = "\0".join(g.nomes).encode("utf-8")
+    n, m = g.num_nos, g.num_arestas
+    with open(caminho, "wb") as f:
+        f.write(_CABECALHO.pack(_MAGICO, _VERSAO, 0, n, m, len(nomes)))
+        f.write(nomes)
+        f.write(b"\0" * (_alinhar(len(nomes)) - len(nomes)))
+        f.write(memoryview(array("q", g.offsets)).cast("B"))
+        f.write(memoryview(array("i", g.alvos)).cast("B"))
+        f.write(b"\0" * (_alinhar(4 * m) - 4 * m))
+        f.write(memoryview(array("d", g.pesos)).cast("B"))
+
+
+def abrir_snapshot(caminho: str) -> GrafoCompacto:
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+    if sys.byteorder != "little":
+        raise RuntimeError("Snapshot binário só é suportado em máquinas little-endian.")
+    with open(caminho, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magico, versao, _, n, m, tam_nomes = _CABECALHO.unpack_from(mapa, 0)
+    if magico != _MAGICO or versao != _VERSAO:
+        raise ValueError(f"Snapshot inválido ou de versão incompatível: {caminho}")
+
+    pos = _CABECALHO.size
+    bruto = memoryview(mapa)
+    nomes = bytes(bruto[pos:pos + tam_nomes]).decode("utf-8").split("\0") if n else []
+    pos += _alinhar(tam_nomes)
+    offsets = bruto[pos:pos + 8 * (n + 1)].cast("q")
+    pos += 8 * (n + 1)
+    alvos = bruto[pos:pos + 4 * m].cast("i")
+    pos += _alinhar(4 * m)
+    pesos = bruto[pos:pos + 8 * m].cast("d")
+    if len(nomes) != n or pos + 8 * m > len(mapa):
+        raise ValueError(f"Snapshot truncado ou corrompido: {caminho}")
+
+    g = GrafoCompacto(nomes, offsets, alvos, pesos)
+    g.arquivo = caminho
+    return g
+
+
 def _carregar_raw(caminho: str):
     if not os.path.exists(caminho):
         raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
     _, ext = os.path.splitext(caminho.lower())
-    with open(caminho, "r", encoding="utf-8") as f:
-        conteudo = f.read()
     if ext in (".json", ".jsn"):
-        return json.loads(conteudo)
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
     elif ext in (".yml", ".yaml"):
         if yaml is None:
             raise RuntimeError("PyYAML não instalado. Use JSON ou instale pyyaml.")
-        return yaml.safe_load(conteudo)
+        with open(caminho, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    elif ext in EXT_ARESTAS:
+        g: Dict[str, Dict[str, float]] = {}
+        for origem, destino, custo in _ler_arestas(caminho):
+            g.setdefault(origem, {})[destino] = custo
+            g.setdefault(destino, {})
+        return g
     else:
-        raise ValueError("Extensão não suportada. Use .json ou .yaml/.yml")
+        raise ValueError("Extensão não suportada. Use .json, .yaml/.yml, .csv ou .ndjson")
 
 
 def _normalizar_tudo(data: Any) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]], Dict[str, Any]]:
@@ -35,7 +155,7 @@ def _normalizar_tudo(data: Any) -> Tuple[Dict[str, Dict[str, float]], Dict[str,
         heur_raw = data.get("heuristica", {})
         cfg = data.get("config", {})
         grafo = _normalizar_adjacencia(grafo_raw)
-        heuristica = _normalizar_heuristica(heur_raw)
+        heuristica = _normalizar_heuristica(heur_raw) or heuristica_de_config(cfg) or {}
         return grafo, heuristica, cfg
 
     if isinstance(data, dict) and data:
@@ -96,3 +216,20 @@ def _normalizar_heuristica(h: Any) -> Dict[str, Dict[str, float]]:
             continue
         out[str(objetivo)] = {str(no): float(val) for no, val in mapa.items()}
     return out
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Converte um grafo para o snapshot binário (.grafo).")
+    parser.add_argument("entrada", help="arquivo JSON/YAML/CSV/NDJSON do grafo")
+    parser.add_argument("saida", help="arquivo .grafo de saída")
+    args = parser.parse_args(argv)
+
+    g, _, _ = carregar_compacto(args.entrada)
+    salvar_snapshot(g, args.saida)
+    print(f"{g.num_nos} nós, {g.num_arestas} arestas -> {args.saida} ({os.path.getsize(args.saida)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+from .cache import impressao_digital
+from .grafo_compacto import arvore_compacta, compilar
+
+
+class _HeuristicaAlvo:
+    def __init__(self, landmarks: "Landmarks", objetivo: str):
+        self.landmarks = landmarks
+        self.t = landmarks.indice.get(objetivo)
+        if self.t is not None:
+            self.ida_t = [d[self.t] for d in landmarks.ida]
+            self.volta_t = [d[self.t] for d in landmarks.volta]
+
+    def get(self, no, default=0.0) -> float:
+        if self.t is None:
+            return default
+        v = self.landmarks.indice.get(no)
+        if v is None:
+            return default
+        return self._estimar(v)
+
+    def _estimar(self, v: int) -> float:
+        melhor = 0.0
+        lm = self.landmarks
+        for i in range(len(lm.marcos)):
+            a_t, a_v = self.ida_t[i], lm.ida[i][v]
+            if a_t != math.inf and a_v != math.inf and a_t - a_v > melhor:
+                melhor = a_t - a_v
+            b_t, b_v = self.volta_t[i], lm.volta[i][v]
+            if b_t != math.inf and b_v != math.inf and b_v - b_t > melhor:
+                melhor = b_v - b_t
+        return melhor
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        if self.t is None:
+            return iter(())
+        return ((no, self._estimar(v)) for v, no in enumerate(self.landmarks.nomes))
+
+
+class _HeuristicaOrigem:
+    def __init__(self, landmarks: "Landmarks", inicio: str):
+        self.landmarks = landmarks
+        self.s = landmarks.indice.get(inicio)
+        if self.s is not None:
+            self.ida_s = [d[self.s] for d in landmarks.ida]
+            self.volta_s = [d[self.s] for d in landmarks.volta]
+
+    def get(self, no, default=0.0) -> float:
+        if self.s is None:
+            return default
+        v = self.landmarks.indice.get(no)
+        if v is None:
+            return default
+        # limite inferior de d(inicio, v): d(L,v) - d(L,inicio) e d(inicio,L) - d(v,L)
+        melhor = 0.0
+        lm = self.landmarks
+        for i in range(len(lm.marcos)):
+            a_s, a_v = self.ida_s[i], lm.ida[i][v]
+            if a_s != math.inf and a_v != math.inf and a_v - a_s > melhor:
+                melhor = a_v - a_s
+            b_s, b_v = self.volta_s[i], lm.volta[i][v]
+            if b_s != math.inf and b_v != math.inf and b_s - b_v > melhor:
+                melhor = b_s - b_v
+        return melhor
+
+
+class Landmarks:
+    def __init__(self, nomes: List[str], marcos: List[str], ida: List[array], volta: List[array],
+                 impressao: Optional[str] = None):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = {no: i for i, no in enumerate(nomes)}
+        self.marcos = marcos
+        self.ida = ida
+        self.volta = volta
+        self.impressao = impressao
+
+    @classmethod
+    def construir(cls, grafo, k: int = 8, metodo: str = "distante", semente: int = 0) -> "Landmarks":
+        g = compilar(grafo)
+        n = g.num_nos
+        if n == 0:
+            return cls([], [], [], [], impressao_digital(g))
+        k = max(1, min(int(k), n))
+        rng = random.Random(semente)
+        rev = g.reverso()
+
+        escolhidos: List[int] = []
+        ida: List[array] = []
+        volta: List[array] = []
+
+        if metodo == "aleatorio":
+            escolhidos = rng.sample(range(n), k)
+            for s in escolhidos:
+                ida.append(arvore_compacta(g, s)[0])
+                volta.append(arvore_compacta(rev, s)[0])
+        elif metodo == "distante":
+            # o primeiro marco é o nó mais distante de uma semente aleatória
+            d0 = arvore_compacta(g, rng.randrange(n))[0]
+            proximo = max(range(n), key=lambda v: d0[v] if d0[v] != math.inf else -1.0)
+            cobertura = array("d", [math.inf]) * n
+            while len(escolhidos) < k:
+                escolhidos.append(proximo)
+                d_ida = arvore_compacta(g, proximo)[0]
+                d_volta = arvore_compacta(rev, proximo)[0]
+                ida.append(d_ida)
+                volta.append(d_volta)
+                for v in range(n):
+                    d = d_ida[v] + d_volta[v]
+                    if d < cobertura[v]:
+                        cobertura[v] = d
+                usados = set(escolhidos)
+                candidatos = [v for v in range(n) if v not in usados]
+                if not candidatos:
+                    break
+                proximo = max(candidatos, key=lambda v: cobertura[v])
+        else:
+            raise ValueError("Método de escolha inválido. Use 'distante' ou 'aleatorio'.")
+
+        return cls(list(g.nomes), [g.nomes[s] for s in escolhidos], ida, volta, impressao_digital(g))
+
+    def __bool__(self) -> bool:
+        return bool(self.marcos)
+
+    def get(self, objetivo, default=None) -> _HeuristicaAlvo:
+        return _HeuristicaAlvo(self, objetivo)
+
+    def origem(self, inicio) -> _HeuristicaOrigem:
+        return _HeuristicaOrigem(self, inicio)
+
+    def estimar(self, objetivo: str, no: str) -> float:
+        return self.get(objetivo).get(no, 0.0)
+
+    __call__ = estimar
+
+    def salvar(self, caminho: str):
+        def _lista(d):
+            return [x if x != math.inf else None for x in d]
+        data = {
+            "impressao": self.impressao,
+            "nomes": self.nomes,
+            "marcos": self.marcos,
+            "ida": [_lista(d) for d in self.ida],
+            "volta": [_lista(d) for d in self.volta],
+        }
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "Landmarks":
+        with open(caminho, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        def _array(lista):
+            return array("d", (math.inf if x is None else float(x) for x in lista))
+        return cls(
+            data["nomes"], data["marcos"],
+            [_array(d) for d in data["ida"]], [_array(d) for d in data["volta"]],
+            data.get("impressao"),
+        )
+
+
+def caminho_landmarks(caminho_grafo: str) -> str:
+    return caminho_grafo + ".landmarks.json"
+
+
+def carregar_ou_construir(caminho_grafo: str, grafo, k: int = 8) -> Landmarks:
+    destino = caminho_landmarks(caminho_grafo)
+    grafo = compilar(grafo)
+    impressao = impressao_digital(grafo)
+    if os.path.exists(destino):
+        try:
+            lm = Landmarks.carregar(destino)
+            if lm.impressao == impressao and len(lm.marcos) >= min(k, len(lm.nomes)):
+                return lm
+        except (OSError, ValueError, KeyError):
+            pass
+    lm = Landmarks.construir(grafo, k)
+    try:
+        lm.salvar(destino)
+    except OSError:
+        pass
+    return lm
+
+
+def main(argv=None):
+    from .io_utils import carregar_com_heuristica
+
+    parser = argparse.ArgumentParser(description="Pré-processa marcos (landmarks) para a heurística ALT.")
+    parser.add_argument("grafo", help="arquivo JSON/YAML do grafo")
+    parser.add_argument("-k", type=int, default=8, help="quantidade de marcos")
+    parser.add_argument("--metodo", default="distante", choices=["distante", "aleatorio"])
+    parser.add_argument("--saida", default=None, help="arquivo de saída (padrão: <grafo>.landmarks.json)")
+    args = parser.parse_args(argv)
+
+    grafo, _, _ = carregar_com_heuristica(args.grafo)
+    t0 = time.perf_counter()
+    lm = Landmarks.construir(grafo, args.k, args.metodo)
+    segundos = time.perf_counter() - t0
+    saida = args.saida or caminho_landmarks(args.grafo)
+    lm.salvar(saida)
+    print(f"{len(lm.marcos)} marcos ({', '.join(lm.marcos)}) em {segundos:.3f}s -> {saida}")
+
+
+if __name__ == "__main__":
+    main()
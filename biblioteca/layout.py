@@ -0,0 +1,179 @@
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import math
+import os
+
+from .cache import impressao_digital
+from .grafo_compacto import GrafoCompacto, compilar
+from .heuristicas import ler_coordenadas
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+Posicoes = Dict[str, Tuple[float, float]]
+
+LIMITE_FORCAS = 1000
+
+
+def coordenadas_de_config(cfg: Optional[Dict[str, Any]], nomes: List[str]) -> Optional[Posicoes]:
+    coords = ler_coordenadas(cfg)
+    if not coords or any(no not in coords for no in nomes):
+        return None
+    return {no: coords[no] for no in nomes}
+
+
+def normalizar(pos: Posicoes) -> Posicoes:
+    if not pos:
+        return {}
+    xs = [p[0] for p in pos.values()]
+    ys = [p[1] for p in pos.values()]
+    x0, y0 = min(xs), min(ys)
+    lado = max(max(xs) - x0, max(ys) - y0) or 1.0
+    dx = (1.0 - (max(xs) - x0) / lado) / 2
+    dy = (1.0 - (max(ys) - y0) / lado) / 2
+    return {no: (dx + (x - x0) / lado, dy + (y - y0) / lado) for no, (x, y) in pos.items()}
+
+
+def _circulo(nomes: List[str]) -> Posicoes:
+    n = max(1, len(nomes))
+    return {no: (0.5 + 0.5 * math.cos(2 * math.pi * i / n), 0.5 + 0.5 * math.sin(2 * math.pi * i / n))
+            for i, no in enumerate(nomes)}
+
+
+def _arestas_np(g: GrafoCompacto):
+    n = g.num_nos
+    graus = np.diff(np.asarray(g.offsets, dtype=np.int64))
+    origens = np.repeat(np.arange(n), graus)
+    alvos = np.asarray(g.alvos, dtype=np.int64)
+    return origens, alvos
+
+
+def _espectral(g: GrafoCompacto, iteracoes: int = 300, semente: int = 0):
+    # autovetores de D⁻¹A por iteração da potência com D-ortogonalização (Koren), O(m) por passo
+    n = g.num_nos
+    origens, alvos = _arestas_np(g)
+    u = np.concatenate([origens, alvos])
+    v = np.concatenate([alvos, origens])
+    grau = np.bincount(u, minlength=n).astype(float)
+    grau[grau == 0] = 1.0
+    rng = np.random.default_rng(semente)
+    vetores = [np.ones(n)]
+    for _ in range(2):
+        x = rng.random(n) - 0.5
+        for _ in range(iteracoes):
+            for w in vetores:
+                x -= (x @ (grau * w)) / (w @ (grau * w)) * w
+            x = 0.5 * (x + np.bincount(u, weights=x[v], minlength=n) / grau)
+            norma = np.linalg.norm(x)
+            if norma == 0:
+                break
+            x /= norma
+        vetores.append(x)
+    return np.column_stack(vetores[1:])
+
+
+def _forcas(pos, origens, alvos, iteracoes: int = 60):
+    # Fruchterman-Reingold vetorizado, O(n²) por iteração
+    n = len(pos)
+    k2 = 1.0 / n
+    temperatura = 0.1
+    x, y = pos[:, 0].copy(), pos[:, 1].copy()
+    for _ in range(iteracoes):
+        dx = x[:, None] - x[None, :]
+        dy = y[:, None] - y[None, :]
+        repulsao = dx * dx
+        repulsao += dy * dy
+        np.maximum(repulsao, 1e-8, out=repulsao)
+        np.divide(k2, repulsao, out=repulsao)
+        np.fill_diagonal(repulsao, 0.0)
+        desloc_x = (dx * repulsao).sum(1)
+        desloc_y = (dy * repulsao).sum(1)
+        ax, ay = x[origens] - x[alvos], y[origens] - y[alvos]
+        atracao = np.sqrt((ax * ax + ay * ay) / k2)
+        fx, fy = ax * atracao, ay * atracao
+        desloc_x += np.bincount(alvos, fx, n) - np.bincount(origens, fx, n)
+        desloc_y += np.bincount(alvos, fy, n) - np.bincount(origens, fy, n)
+        comprimento = np.maximum(np.hypot(desloc_x, desloc_y), 1e-9)
+        passo = np.minimum(comprimento, temperatura) / comprimento
+        x += desloc_x * passo
+        y += desloc_y * passo
+        temperatura *= 0.93
+    return np.column_stack([x, y])
+
+
+def _normalizar_np(pos):
+    pos = pos - pos.min(0)
+    lado = pos.max() or 1.0
+    pos = pos / lado
+    return pos + (1.0 - pos.max(0)) / 2
+
+
+def calcular_layout(grafo, cfg: Optional[Dict[str, Any]] = None, metodo: str = "auto") -> Posicoes:
+    g = compilar(grafo)
+    nomes = g.nomes
+    pos = coordenadas_de_config(cfg, nomes)
+    if pos is not None:
+        return normalizar(pos)
+    if metodo == "auto":
+        metodo = "circulo" if np is None or g.num_nos < 3 else "espectral"
+    if metodo == "circulo":
+        return _circulo(nomes)
+    if metodo not in ("espectral", "forcas"):
+        raise ValueError("Método de layout inválido. Use 'auto', 'espectral', 'forcas' ou 'circulo'.")
+    if np is None:
+        raise RuntimeError("NumPy não instalado. Instale numpy para usar o layout espectral/por forças.")
+
+    xy = _normalizar_np(_espectral(g))
+    if metodo == "forcas" or g.num_nos <= LIMITE_FORCAS:
+        origens, alvos = _arestas_np(g)
+        xy = _normalizar_np(_forcas(xy, origens, alvos))
+    return {no: (float(xy[i, 0]), float(xy[i, 1])) for i, no in enumerate(nomes)}
+
+
+def caminho_layout(caminho_grafo: str) -> str:
+    return caminho_grafo + ".layout.json"
+
+
+def salvar_layout(pos: Posicoes, caminho: str, impressao: Optional[str] = None):
+    nomes = list(pos)
+    data = {
+        "impressao": impressao,
+        "nomes": nomes,
+        "x": [pos[no][0] for no in nomes],
+        "y": [pos[no][1] for no in nomes],
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def carregar_layout(caminho: str) -> Tuple[Posicoes, Optional[str]]:
+    with open(caminho, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    pos = {no: (float(x), float(y)) for no, x, y in zip(data["nomes"], data["x"], data["y"])}
+    return pos, data.get("impressao")
+
+
+def carregar_ou_calcular(caminho_grafo: str, grafo, cfg: Optional[Dict[str, Any]] = None) -> Posicoes:
+    g = compilar(grafo)
+    pos = coordenadas_de_config(cfg, g.nomes)
+    if pos is not None:
+        return normalizar(pos)
+    destino = caminho_layout(caminho_grafo)
+    impressao = impressao_digital(g)
+    if os.path.exists(destino):
+        try:
+            pos, impressao_arq = carregar_layout(destino)
+            if impressao_arq == impressao and len(pos) == g.num_nos:
+                return pos
+        except (OSError, ValueError, KeyError):
+            pass
+    pos = calcular_layout(g)
+    if np is not None:
+        try:
+            salvar_layout(pos, destino, impressao)
+        except OSError:
+            pass
+    return pos
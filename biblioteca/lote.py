@@ -0,0 +1,136 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import os
+
+from .astar import BuscaAEstrela, BuscaAEstrelaPonderada, BuscaGulosa
+from .bidirecional import BuscaBidirecionalAEstrela, BuscaBidirecionalCustoUniforme
+from .memoria_limitada import BuscaFeixe, BuscaIDAEstrela, BuscaSMAEstrela
+from .search_base import AlgoritmoBusca
+from .ucs import BuscaCustoUniforme
+
+
+ALGORITMOS = {
+    "ucs": BuscaCustoUniforme,
+    "astar": BuscaAEstrela,
+    "astar_ponderado": BuscaAEstrelaPonderada,
+    "gulosa": BuscaGulosa,
+    "ucs_bidirecional": BuscaBidirecionalCustoUniforme,
+    "astar_bidirecional": BuscaBidirecionalAEstrela,
+    "ida_estrela": BuscaIDAEstrela,
+    "sma_estrela": BuscaSMAEstrela,
+    "feixe": BuscaFeixe,
+}
+
+ResultadoLote = Tuple[int, str, str, List[str], float, float]
+
+
+def criar_algoritmo(nome: str, peso: Optional[float] = None) -> AlgoritmoBusca:
+    try:
+        cls = ALGORITMOS[nome]
+    except KeyError:
+        raise ValueError(f"Algoritmo desconhecido: {nome}. Opções: {', '.join(ALGORITMOS)}") from None
+    if peso is not None and issubclass(cls, BuscaAEstrela):
+        return cls(peso=float(peso))
+    return cls()
+
+
+_ESTADO: Dict[str, Any] = {}
+
+
+def _inicializar_trabalhador(grafo, heuristica, algoritmo: str, peso: Optional[float]):
+    _ESTADO["grafo"] = grafo
+    _ESTADO["heuristica"] = heuristica or {}
+    _ESTADO["algoritmo"] = criar_algoritmo(algoritmo, peso)
+
+
+def _resolver_bloco(bloco: List[Tuple[int, str, str]]) -> List[ResultadoLote]:
+    return _resolver_com(_ESTADO["grafo"], _ESTADO["heuristica"], _ESTADO["algoritmo"], bloco)
+
+
+def _resolver_com(grafo, heuristica, algoritmo: AlgoritmoBusca, bloco) -> List[ResultadoLote]:
+    saida = []
+    for i, inicio, objetivo in bloco:
+        caminho, custo, segundos = algoritmo.resolver(grafo, inicio, objetivo, heuristica=heuristica)
+        saida.append((i, inicio, objetivo, caminho, custo, segundos))
+    return saida
+
+
+def _blocos(consultas: Iterable[Tuple[str, str]], tamanho: int) -> Iterator[List[Tuple[int, str, str]]]:
+    numeradas = ((i, s, t) for i, (s, t) in enumerate(consultas))
+    while True:
+        bloco = list(islice(numeradas, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def resolver_lote(
+    grafo,
+    consultas: Iterable[Tuple[str, str]],
+    algoritmo: str = "ucs",
+    heuristica: Optional[Dict[str, Dict[str, float]]] = None,
+    peso: Optional[float] = None,
+    processos: Optional[int] = None,
+    tamanho_bloco: int = 256,
+    ordenado: bool = True,
+) -> Iterator[ResultadoLote]:
+    criar_algoritmo(algoritmo, peso)
+    if processos is None:
+        processos = os.cpu_count() or 1
+    blocos = _blocos(consultas, max(1, int(tamanho_bloco)))
+
+    if processos <= 1:
+        yield from _resolver_sequencial(grafo, blocos, algoritmo, heuristica, peso)
+        return
+
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=processos,
+            initializer=_inicializar_trabalhador,
+            initargs=(grafo, heuristica, algoritmo, peso),
+        )
+    except (OSError, NotImplementedError, ImportError):
+        yield from _resolver_sequencial(grafo, blocos, algoritmo, heuristica, peso)
+        return
+
+    limite = 2 * processos
+    pendentes: Dict[Any, List[Tuple[int, str, str]]] = {}
+    submetendo = None
+    with executor:
+        try:
+            for bloco in blocos:
+                submetendo = bloco
+                pendentes[executor.submit(_resolver_bloco, bloco)] = bloco
+                submetendo = None
+                if len(pendentes) >= limite:
+                    yield from _colher(pendentes, ordenado)
+            while pendentes:
+                yield from _colher(pendentes, ordenado)
+            return
+        except BrokenProcessPool:
+            pass
+
+    # um trabalhador morreu: refaz em série os blocos ainda não entregues
+    restantes = list(pendentes.values())
+    if submetendo is not None:
+        restantes.append(submetendo)
+    yield from _resolver_sequencial(grafo, chain(restantes, blocos), algoritmo, heuristica, peso)
+
+
+def _colher(pendentes: Dict[Any, List[Tuple[int, str, str]]], ordenado: bool) -> Iterator[ResultadoLote]:
+    if ordenado:
+        prontos = [next(iter(pendentes))]
+    else:
+        prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+    for futuro in prontos:
+        resultado = futuro.result()
+        del pendentes[futuro]
+        yield from resultado
+
+
+def _resolver_sequencial(grafo, blocos, algoritmo, heuristica, peso) -> Iterator[ResultadoLote]:
+    instancia = criar_algoritmo(algoritmo, peso)
+    for bloco in blocos:
+        yield from _resolver_com(grafo, heuristica or {}, instancia, bloco)
@@ -0,0 +1,138 @@
+from typing import Iterable, List, Optional
+import time
+
+from .grafo_compacto import GrafoCompacto, arvore_compacta, compilar
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+LIMITE_FLOYD = 1000
+
+
+def _exigir_numpy():
+    if np is None:
+        raise RuntimeError("NumPy não instalado. Instale numpy para usar a matriz de distâncias.")
+
+
+def escolher_metodo(g: GrafoCompacto, n_origens: int, metodo: str = "auto") -> str:
+    if metodo != "auto":
+        return metodo
+    n = g.num_nos
+    # Floyd-Warshall vetorizado custa O(n³) em C; Dijkstra custa O(origens · m log n) em Python
+    if n <= LIMITE_FLOYD and n_origens * 10 >= n:
+        return "floyd"
+    return "dijkstra"
+
+
+def _floyd_warshall(g: GrafoCompacto, predecessores: bool):
+    n = g.num_nos
+    offsets = np.asarray(g.offsets, dtype=np.int64)
+    origem = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    alvo = np.asarray(g.alvos, dtype=np.int64)
+    peso = np.asarray(g.pesos, dtype=np.float64)
+
+    dist = np.full((n, n), np.inf)
+    np.minimum.at(dist, (origem, alvo), peso)
+    np.fill_diagonal(dist, 0.0)
+
+    pred = None
+    if predecessores:
+        pred = np.where(np.isfinite(dist), np.arange(n, dtype=np.int32)[:, None], -1).astype(np.int32)
+        np.fill_diagonal(pred, -1)
+
+    for k in range(n):
+        via = dist[:, k, None] + dist[None, k, :]
+        if predecessores:
+            melhor = via < dist
+            dist[melhor] = via[melhor]
+            pred = np.where(melhor, pred[k][None, :], pred)
+        else:
+            np.minimum(dist, via, out=dist)
+    return dist, pred
+
+
+def matriz_distancias(
+    grafo,
+    origens: Optional[Iterable[str]] = None,
+    destinos: Optional[Iterable[str]] = None,
+    predecessores: bool = False,
+    metodo: str = "auto",
+):
+    _exigir_numpy()
+    g = compilar(grafo)
+    origens = list(origens) if origens is not None else list(g.nomes)
+    destinos = list(destinos) if destinos is not None else list(g.nomes)
+    ids_o = np.array([g.id_de(o) for o in origens], dtype=np.int64)
+    ids_d = np.array([g.id_de(d) for d in destinos], dtype=np.int64)
+    metodo = escolher_metodo(g, len(ids_o), metodo)
+
+    if metodo == "floyd":
+        dist, pred = _floyd_warshall(g, predecessores)
+        saida = dist[np.ix_(ids_o, ids_d)]
+        return (saida, pred[ids_o]) if predecessores else saida
+    if metodo != "dijkstra":
+        raise ValueError("Método inválido. Use 'auto', 'floyd' ou 'dijkstra'.")
+
+    n = g.num_nos
+    saida = np.full((len(ids_o), len(ids_d)), np.inf)
+    pred = np.full((len(ids_o), n), -1, dtype=np.int32) if predecessores else None
+    # com predecessores a árvore é completa, para que cada linha valha para qualquer nó, como no Floyd
+    alvos = None if predecessores else ids_d.tolist()
+    for i, s in enumerate(ids_o.tolist()):
+        d, pai, _, _ = arvore_compacta(g, s, alvos)
+        saida[i] = np.frombuffer(d, dtype=np.float64)[ids_d]
+        if predecessores:
+            pred[i] = np.frombuffer(pai, dtype=np.int32)
+    return (saida, pred) if predecessores else saida
+
+
+def caminho_pela_matriz(grafo, pred, linha: int, origem: str, destino: str) -> List[str]:
+    g = compilar(grafo)
+    s, v = g.id_de(origem), g.id_de(destino)
+    caminho: List[str] = []
+    while v != -1:
+        caminho.append(g.nomes[v])
+        if v == s:
+            caminho.reverse()
+            return caminho
+        v = int(pred[linha, v])
+    return []
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    from .io_utils import carregar_compacto
+
+    parser = argparse.ArgumentParser(description="Calcula a matriz de distâncias origem × destino.")
+    parser.add_argument("grafo", help="arquivo do grafo")
+    parser.add_argument("--origens", nargs="*", default=None)
+    parser.add_argument("--destinos", nargs="*", default=None)
+    parser.add_argument("--metodo", choices=["auto", "floyd", "dijkstra"], default="auto")
+    parser.add_argument("--saida", default=None, help="arquivo CSV (padrão: saída padrão)")
+    args = parser.parse_args(argv)
+
+    g, _, _ = carregar_compacto(args.grafo)
+    origens = args.origens or list(g.nomes)
+    destinos = args.destinos or list(g.nomes)
+    t0 = time.perf_counter()
+    dist = matriz_distancias(g, origens, destinos, metodo=args.metodo)
+    segundos = time.perf_counter() - t0
+
+    destino = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    try:
+        destino.write("," + ",".join(destinos) + "\n")
+        for o, linha in zip(origens, dist):
+            destino.write(o + "," + ",".join("" if not np.isfinite(x) else f"{x:g}" for x in linha) + "\n")
+    finally:
+        if args.saida:
+            destino.close()
+    print(f"{len(origens)}x{len(destinos)} em {segundos:.3f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+from typing import Dict, List, Optional, Tuple
+import heapq
+import itertools
+import math
+import time
+
+from .heuristicas import funcao_heuristica
+from .observadores import trilha_de
+from .search_base import AlgoritmoBusca, funcao_vizinhos
+
+
+INF = math.inf
+
+
+class _BuscaMemoriaLimitada(AlgoritmoBusca):
+    memoria_max = 0
+    otimo_garantido = False
+
+    def resolver(self, grafo, inicio, objetivo, **kwargs):
+        heuristica = kwargs.get("heuristica", {})
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, heuristica,
+                                                               registrar_trilha=False)
+        return caminho, custo, segundos
+
+    def resolver_com_trilha(self, grafo, inicio, objetivo, heuristica=None, registrar_trilha: bool = True):
+        t0 = time.perf_counter()
+        obs, registro = self._preparar_observador(registrar_trilha)
+        self.memoria_max = 0
+        self.otimo_garantido = False
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+        caminho, custo = self._buscar(funcao_vizinhos(grafo), funcao_heuristica(heuristica, objetivo),
+                                      inicio, objetivo, obs)
+        if obs is not None:
+            if caminho:
+                obs.ao_encontrar(objetivo, custo)
+            obs.ao_terminar()
+        trilha = trilha_de(registro, caminho)
+        trilha["memoria_max"] = self.memoria_max
+        trilha["otimo_garantido"] = self.otimo_garantido
+        return caminho, float(custo), float(time.perf_counter() - t0), trilha
+
+    def _buscar(self, vizinhos, h, inicio, objetivo, obs) -> Tuple[List[str], float]:
+        raise NotImplementedError
+
+
+class BuscaIDAEstrela(_BuscaMemoriaLimitada):
+    def __init__(self, limite_tabela: int = 100000, folga: float = 0.0, observador=None):
+        super().__init__(observador)
+        self.limite_tabela = max(0, int(limite_tabela))
+        self.folga = max(0.0, float(folga))
+
+    def _buscar(self, vizinhos, h, inicio, objetivo, obs):
+        limite = h(inicio)
+        # com custos reais cada iteração pode avançar muito pouco; folga > 0 aumenta o limite em pelo
+        # menos essa fração e garante custo <= (1 + folga) · ótimo
+        exato = True
+        while True:
+            # tabela de transposição: melhor g visto nesta iteração, com no máximo limite_tabela entradas
+            tabela: Dict[str, float] = {inicio: 0.0} if self.limite_tabela else {}
+            caminho = [inicio]
+            no_caminho = {inicio}
+            custos = [0.0]
+            pilha = [iter(vizinhos(inicio))]
+            proximo_limite = INF
+            if obs is not None:
+                obs.ao_expandir(inicio)
+            if inicio == objetivo:
+                self.memoria_max = 1
+                self.otimo_garantido = True
+                return caminho, 0.0
+
+            while pilha:
+                try:
+                    viz, passo = next(pilha[-1])
+                except StopIteration:
+                    pilha.pop()
+                    no_caminho.discard(caminho.pop())
+                    custos.pop()
+                    continue
+                if viz in no_caminho:
+                    continue
+                g = custos[-1] + float(passo)
+                if obs is not None:
+                    obs.ao_relaxar(caminho[-1], viz, g)
+                f = g + h(viz)
+                if f > limite:
+                    if f < proximo_limite:
+                        proximo_limite = f
+                    continue
+                anterior = tabela.get(viz)
+                if anterior is not None and g >= anterior:
+                    continue
+                if anterior is not None or len(tabela) < self.limite_tabela:
+                    tabela[viz] = g
+                if obs is not None:
+                    obs.ao_expandir(viz)
+                caminho.append(viz)
+                if viz == objetivo:
+                    self.memoria_max = max(self.memoria_max, len(tabela) + len(caminho))
+                    self.otimo_garantido = exato
+                    return caminho, g
+                no_caminho.add(viz)
+                custos.append(g)
+                pilha.append(iter(vizinhos(viz)))
+                memoria = len(tabela) + len(caminho)
+                if memoria > self.memoria_max:
+                    self.memoria_max = memoria
+
+            if proximo_limite == INF:
+                self.otimo_garantido = True
+                return [], INF
+            if proximo_limite < limite * (1.0 + self.folga):
+                exato = False
+                proximo_limite = limite * (1.0 + self.folga)
+            limite = proximo_limite
+
+
+class _NoSMA:
+    __slots__ = ("estado", "g", "f", "pai", "profundidade", "sucessores", "proximo", "filhos", "esquecidos",
+                 "aberto", "versao", "vivo")
+
+    def __init__(self, estado, g: float, f: float, pai: Optional["_NoSMA"]):
+        self.estado = estado
+        self.g = g
+        self.f = f
+        self.pai = pai
+        self.profundidade = 0 if pai is None else pai.profundidade + 1
+        self.sucessores: Optional[Dict[str, float]] = None
+        self.proximo: Optional[List[str]] = None
+        self.filhos: Dict[str, "_NoSMA"] = {}
+        self.esquecidos: Dict[str, float] = {}
+        self.aberto = False
+        self.versao = 0
+        self.vivo = True
+
+
+class BuscaSMAEstrela(_BuscaMemoriaLimitada):
+    def __init__(self, limite_nos: int = 100000, observador=None):
+        super().__init__(observador)
+        self.limite_nos = max(2, int(limite_nos))
+
+    def _buscar(self, vizinhos, h, inicio, objetivo, obs):
+        limite = self.limite_nos
+        contador = itertools.count()
+        melhores: List[tuple] = []
+        piores: List[tuple] = []
+        # só o corte por profundidade (caminho maior que a memória) tira a garantia de otimalidade
+        truncou = False
+
+        def abrir(n: _NoSMA):
+            n.aberto = True
+            n.versao += 1
+            heapq.heappush(melhores, (n.f, -n.profundidade, next(contador), n.versao, n))
+            heapq.heappush(piores, (-n.f, n.profundidade, next(contador), n.versao, n))
+
+        def valido(entrada) -> bool:
+            n = entrada[-1]
+            return n.vivo and n.aberto and n.versao == entrada[-2]
+
+        def propagar(n: _NoSMA):
+            # atualiza f pelo mínimo dos filhos (em memória ou esquecidos) e sobe pelos ancestrais
+            while n is not None and n.proximo is not None and not n.proximo:
+                f = min(itertools.chain((c.f for c in n.filhos.values()), n.esquecidos.values()), default=INF)
+                if f == n.f:
+                    return
+                n.f = f
+                if n.aberto:
+                    abrir(n)
+                n = n.pai
+
+        def esquecer_pior(protegido: _NoSMA) -> bool:
+            adiados = []
+            try:
+                while piores:
+                    entrada = heapq.heappop(piores)
+                    if not valido(entrada):
+                        continue
+                    n = entrada[-1]
+                    if n is protegido or n.pai is None or n.filhos:
+                        adiados.append(entrada)
+                        continue
+                    n.vivo = False
+                    n.aberto = False
+                    if na_memoria.get(n.estado) is n:
+                        del na_memoria[n.estado]
+                    pai = n.pai
+                    del pai.filhos[n.estado]
+                    pai.esquecidos[n.estado] = n.f
+                    if obs is not None:
+                        obs.ao_descartar(n.estado)
+                    if not pai.aberto:
+                        abrir(pai)
+                    return True
+                return False
+            finally:
+                for entrada in adiados:
+                    heapq.heappush(piores, entrada)
+
+        raiz = _NoSMA(inicio, 0.0, h(inicio), None)
+        # melhor nó em memória por estado: sucessores dominados (g maior ou igual) não são gerados
+        na_memoria: Dict[str, _NoSMA] = {inicio: raiz}
+        usados = 1
+        abrir(raiz)
+        if obs is not None:
+            obs.ao_inserir(inicio, raiz.f)
+
+        while melhores:
+            entrada = heapq.heappop(melhores)
+            if not valido(entrada):
+                continue
+            n = entrada[-1]
+            if n.f == INF:
+                break
+            if obs is not None:
+                obs.ao_remover(n.estado, n.f)
+            if n.estado == objetivo:
+                caminho = []
+                m = n
+                while m is not None:
+                    caminho.append(m.estado)
+                    m = m.pai
+                caminho.reverse()
+                self.otimo_garantido = not truncou
+                return caminho, n.g
+
+            if n.sucessores is None:
+                no_caminho = set()
+                m = n
+                while m is not None:
+                    no_caminho.add(m.estado)
+                    m = m.pai
+                n.sucessores = {}
+                for viz, passo in vizinhos(n.estado):
+                    if viz not in no_caminho:
+                        passo = float(passo)
+                        if passo < n.sucessores.get(viz, INF):
+                            n.sucessores[viz] = passo
+                n.proximo = list(n.sucessores)
+                n.proximo.reverse()
+                if obs is not None:
+                    obs.ao_expandir(n.estado)
+                if not n.proximo:
+                    n.f = INF
+                    n.aberto = False
+                    pai = n.pai
+                    if pai is not None:
+                        n.vivo = False
+                        if na_memoria.get(n.estado) is n:
+                            del na_memoria[n.estado]
+                        del pai.filhos[n.estado]
+                        pai.esquecidos[n.estado] = INF
+                        usados -= 1
+                        propagar(pai)
+                        if not pai.aberto:
+                            abrir(pai)
+                    continue
+
+            if n.proximo:
+                estado = n.proximo.pop()
+                g = n.g + n.sucessores[estado]
+                f = max(n.f, g + h(estado))
+            else:
+                estado = min(n.esquecidos, key=n.esquecidos.get)
+                g = n.g + n.sucessores[estado]
+                f = n.esquecidos.pop(estado)
+            if estado != objetivo and n.profundidade + 1 >= limite - 1:
+                f = INF
+                truncou = True
+            if obs is not None:
+                obs.ao_relaxar(n.estado, estado, g)
+
+            existente = na_memoria.get(estado)
+            if existente is not None and existente.g <= g:
+                if obs is not None:
+                    obs.ao_descartar(estado)
+            else:
+                if usados >= limite and esquecer_pior(n):
+                    usados -= 1
+                if usados >= limite:
+                    # nenhuma folha pode ser esquecida: o caminho até aqui já ocupa toda a memória
+                    n.esquecidos[estado] = INF
+                    truncou = True
+                else:
+                    filho = _NoSMA(estado, g, f, n)
+                    n.filhos[estado] = filho
+                    na_memoria[estado] = filho
+                    usados += 1
+                    if usados > self.memoria_max:
+                        self.memoria_max = usados
+                    abrir(filho)
+                    if obs is not None:
+                        obs.ao_inserir(estado, f)
+
+            if not n.proximo and not n.esquecidos:
+                n.aberto = False
+            else:
+                abrir(n)
+            propagar(n)
+
+        self.otimo_garantido = not truncou
+        return [], INF
+
+
+class BuscaFeixe(_BuscaMemoriaLimitada):
+    def __init__(self, largura: int = 1000, limite_tabela: Optional[int] = None, limite_camadas: int = 100000,
+                 observador=None):
+        super().__init__(observador)
+        self.largura = max(1, int(largura))
+        # tabela de duplicatas de tamanho fixo; as entradas mais antigas (camadas passadas) saem primeiro
+        self.limite_tabela = max(self.largura, int(limite_tabela)) if limite_tabela is not None else 4 * self.largura
+        # sem fechados globais a busca pode revisitar ciclos; o limite de camadas garante o término
+        self.limite_camadas = max(1, int(limite_camadas))
+
+    def _buscar(self, vizinhos, h, inicio, objetivo, obs):
+        # cada item da camada guarda o caminho como lista encadeada (no, anterior) compartilhada
+        camada: List[Tuple[float, float, str, tuple]] = [(h(inicio), 0.0, inicio, (inicio, None))]
+        melhor_g: Dict[str, float] = {inicio: 0.0}
+        limite_tabela = self.limite_tabela
+        melhor: Optional[Tuple[float, tuple]] = None
+        podou = False
+        camadas = 0
+        if obs is not None:
+            obs.ao_inserir(inicio, camada[0][0])
+
+        while camada:
+            if melhor is not None and camada[0][0] >= melhor[0]:
+                break
+            if camadas >= self.limite_camadas:
+                podou = True
+                break
+            camadas += 1
+            candidatos: Dict[str, Tuple[float, float, str, tuple]] = {}
+            for f, g, no, cadeia in camada:
+                if obs is not None:
+                    obs.ao_remover(no, f)
+                if g > melhor_g.get(no, INF) or (melhor is not None and f >= melhor[0]):
+                    if obs is not None:
+                        obs.ao_descartar(no)
+                    continue
+                if obs is not None:
+                    obs.ao_expandir(no)
+                if no == objetivo:
+                    if melhor is None or g < melhor[0]:
+                        melhor = (g, cadeia)
+                    continue
+                for viz, passo in vizinhos(no):
+                    g_novo = g + float(passo)
+                    if g_novo >= melhor_g.get(viz, INF):
+                        continue
+                    anterior = candidatos.get(viz)
+                    if anterior is not None and g_novo >= anterior[1]:
+                        continue
+                    if obs is not None:
+                        obs.ao_relaxar(no, viz, g_novo)
+                    candidatos[viz] = (g_novo + h(viz), g_novo, viz, (viz, cadeia))
+            if len(candidatos) > self.largura:
+                podou = True
+                camada = heapq.nsmallest(self.largura, candidatos.values())
+            else:
+                camada = sorted(candidatos.values())
+            memoria = len(melhor_g) + len(candidatos)
+            for f, g, viz, _ in camada:
+                melhor_g.pop(viz, None)
+                melhor_g[viz] = g
+                if obs is not None:
+                    obs.ao_inserir(viz, f)
+            while len(melhor_g) > limite_tabela:
+                del melhor_g[next(iter(melhor_g))]
+            if memoria > self.memoria_max:
+                self.memoria_max = memoria
+
+        self.otimo_garantido = not podou
+        if melhor is None:
+            return [], INF
+        caminho = []
+        cadeia = melhor[1]
+        while cadeia is not None:
+            caminho.append(cadeia[0])
+            cadeia = cadeia[1]
+        caminho.reverse()
+        return caminho, melhor[0]
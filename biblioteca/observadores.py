@@ -0,0 +1,243 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+import time
+
+
+class ObservadorBusca:
+    def ao_iniciar(self, inicio, objetivo):
+        pass
+
+    def ao_inserir(self, no, prioridade: float):
+        pass
+
+    def ao_remover(self, no, prioridade: float):
+        pass
+
+    def ao_descartar(self, no):
+        pass
+
+    def ao_expandir(self, no):
+        pass
+
+    def ao_relaxar(self, origem, destino, custo: float):
+        pass
+
+    def ao_encontrar(self, no, custo: float):
+        pass
+
+    def ao_terminar(self):
+        pass
+
+
+class RegistroTrilha(ObservadorBusca):
+    def __init__(self):
+        self.expandidos: List[Any] = []
+        self.arestas_exploradas: List[Tuple[Any, Any]] = []
+
+    def ao_expandir(self, no):
+        self.expandidos.append(no)
+
+    def ao_relaxar(self, origem, destino, custo):
+        self.arestas_exploradas.append((origem, destino))
+
+    def trilha(self, caminho: List[Any]) -> Dict[str, list]:
+        return {"expandidos": self.expandidos, "arestas_exploradas": self.arestas_exploradas, "caminho_final": caminho}
+
+
+def trilha_de(registro: Optional[RegistroTrilha], caminho: List[Any]) -> Dict[str, list]:
+    if registro is None:
+        return {"expandidos": [], "arestas_exploradas": [], "caminho_final": caminho}
+    return registro.trilha(caminho)
+
+
+class Contadores(ObservadorBusca):
+    def __init__(self):
+        self.zerar()
+
+    def zerar(self):
+        self.insercoes = 0
+        self.remocoes = 0
+        self.descartes = 0
+        self.expansoes = 0
+        self.relaxacoes = 0
+        self.fronteira_max = 0
+        self.encontrado = False
+        self.custo = float('inf')
+        self._t0 = None
+        self.segundos = 0.0
+
+    def ao_iniciar(self, inicio, objetivo):
+        self.zerar()
+        self._t0 = time.perf_counter()
+
+    def ao_inserir(self, no, prioridade):
+        self.insercoes += 1
+        tamanho = self.insercoes - self.remocoes
+        if tamanho > self.fronteira_max:
+            self.fronteira_max = tamanho
+
+    def ao_remover(self, no, prioridade):
+        self.remocoes += 1
+
+    def ao_descartar(self, no):
+        self.descartes += 1
+
+    def ao_expandir(self, no):
+        self.expansoes += 1
+
+    def ao_relaxar(self, origem, destino, custo):
+        self.relaxacoes += 1
+
+    def ao_encontrar(self, no, custo):
+        self.encontrado = True
+        self.custo = float(custo)
+
+    def ao_terminar(self):
+        if self._t0 is not None:
+            self.segundos = time.perf_counter() - self._t0
+
+    @property
+    def relaxacoes_por_segundo(self) -> float:
+        return self.relaxacoes / self.segundos if self.segundos > 0 else 0.0
+
+    def resumo(self) -> Dict[str, Any]:
+        return {
+            "insercoes": self.insercoes,
+            "remocoes": self.remocoes,
+            "descartes": self.descartes,
+            "expansoes": self.expansoes,
+            "relaxacoes": self.relaxacoes,
+            "fronteira_max": self.fronteira_max,
+            "segundos": self.segundos,
+            "relaxacoes_por_segundo": self.relaxacoes_por_segundo,
+            "encontrado": self.encontrado,
+            "custo": self.custo,
+        }
+
+
+class RegistroAmostrado(ObservadorBusca):
+    def __init__(self, intervalo: int = 100, limite: int = 10000):
+        self.intervalo = max(1, int(intervalo))
+        self.limite = limite
+        self.zerar()
+
+    def zerar(self):
+        self.eventos: deque = deque(maxlen=self.limite)
+        self._n = 0
+
+    def ao_iniciar(self, inicio, objetivo):
+        self.zerar()
+
+    def ao_expandir(self, no):
+        self._n += 1
+        if self._n % self.intervalo == 0:
+            self.eventos.append(("expandir", no))
+
+    def ao_relaxar(self, origem, destino, custo):
+        self._n += 1
+        if self._n % self.intervalo == 0:
+            self.eventos.append(("relaxar", origem, destino, custo))
+
+
+class BuscaCancelada(Exception):
+    pass
+
+
+class ObservadorProgresso(ObservadorBusca):
+    def __init__(self, ao_progresso=None, intervalo: int = 1000):
+        self.ao_progresso = ao_progresso
+        self.intervalo = max(1, int(intervalo))
+        self.cancelado = False
+        self.zerar()
+
+    def zerar(self):
+        self.expansoes = 0
+        self.fronteira = 0
+        self.melhor_f = 0.0
+
+    def cancelar(self):
+        self.cancelado = True
+
+    def ao_iniciar(self, inicio, objetivo):
+        self.zerar()
+
+    def ao_inserir(self, no, prioridade):
+        self.fronteira += 1
+
+    def ao_remover(self, no, prioridade):
+        self.fronteira -= 1
+        self.melhor_f = prioridade
+
+    def ao_expandir(self, no):
+        if self.cancelado:
+            raise BuscaCancelada("Busca cancelada")
+        self.expansoes += 1
+        if self.ao_progresso is not None and self.expansoes % self.intervalo == 0:
+            self.ao_progresso(self.expansoes, self.fronteira, self.melhor_f)
+
+
+class ObservadoresMultiplos(ObservadorBusca):
+    def __init__(self, *observadores: ObservadorBusca):
+        self.observadores = [o for o in observadores if o is not None]
+
+    def ao_iniciar(self, inicio, objetivo):
+        for o in self.observadores:
+            o.ao_iniciar(inicio, objetivo)
+
+    def ao_inserir(self, no, prioridade):
+        for o in self.observadores:
+            o.ao_inserir(no, prioridade)
+
+    def ao_remover(self, no, prioridade):
+        for o in self.observadores:
+            o.ao_remover(no, prioridade)
+
+    def ao_descartar(self, no):
+        for o in self.observadores:
+            o.ao_descartar(no)
+
+    def ao_expandir(self, no):
+        for o in self.observadores:
+            o.ao_expandir(no)
+
+    def ao_relaxar(self, origem, destino, custo):
+        for o in self.observadores:
+            o.ao_relaxar(origem, destino, custo)
+
+    def ao_encontrar(self, no, custo):
+        for o in self.observadores:
+            o.ao_encontrar(no, custo)
+
+    def ao_terminar(self):
+        for o in self.observadores:
+            o.ao_terminar()
+
+
+class ObservadorComNomes(ObservadorBusca):
+    def __init__(self, observador: ObservadorBusca, nomes: List[str]):
+        self.observador = observador
+        self.nomes = nomes
+
+    def ao_iniciar(self, inicio, objetivo):
+        self.observador.ao_iniciar(inicio, objetivo)
+
+    def ao_inserir(self, no, prioridade):
+        self.observador.ao_inserir(self.nomes[no], prioridade)
+
+    def ao_remover(self, no, prioridade):
+        self.observador.ao_remover(self.nomes[no], prioridade)
+
+    def ao_descartar(self, no):
+        self.observador.ao_descartar(self.nomes[no])
+
+    def ao_expandir(self, no):
+        self.observador.ao_expandir(self.nomes[no])
+
+    def ao_relaxar(self, origem, destino, custo):
+        self.observador.ao_relaxar(self.nomes[origem], self.nomes[destino], custo)
+
+    def ao_encontrar(self, no, custo):
+        self.observador.ao_encontrar(self.nomes[no], custo)
+
+    def ao_terminar(self):
+        self.observador.ao_terminar()
@@ -1,8 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
+
+from .grafo_compacto import GrafoCompacto
+from .observadores import ObservadorBusca, ObservadoresMultiplos, RegistroTrilha
 
 
 class AlgoritmoBusca(ABC):
+    observador: Optional[ObservadorBusca] = None
+
+    def __init__(self, observador: Optional[ObservadorBusca] = None):
+        self.observador = observador
+
+    def _preparar_observador(self, registrar_trilha: bool) -> Tuple[Optional[ObservadorBusca], Optional[RegistroTrilha]]:
+        registro = RegistroTrilha() if registrar_trilha else None
+        obs = self.observador
+        if registro is not None:
+            obs = registro if obs is None else ObservadoresMultiplos(registro, obs)
+        return obs, registro
+
+    def _memo_por_grafo(self, grafo, chave: str, fabrica):
+        memo = self.__dict__.setdefault("_memo", {})
+        item = memo.get(chave)
+        if item is None or item[0] is not grafo:
+            item = (grafo, fabrica(grafo))
+            memo[chave] = item
+        return item[1]
+
     @abstractmethod
     def resolver(
         self,
@@ -13,3 +36,28 @@ class AlgoritmoBusca(ABC):
     ) -> Tuple[List[str], float, float]:
         
         raise NotImplementedError
+
+
+def reconstruir_caminho(pai: Dict[Any, Optional[Any]], objetivo: Any) -> List[Any]:
+    caminho = []
+    no = objetivo
+    while no is not None:
+        caminho.append(no)
+        no = pai[no]
+    caminho.reverse()
+    return caminho
+
+
+def funcao_vizinhos(grafo):
+    if isinstance(grafo, GrafoCompacto):
+        nomes, indice = grafo.nomes, grafo.indice
+
+        def vizinhos(no):
+            u = indice.get(no)
+            return () if u is None else ((nomes[v], c) for v, c in grafo.arestas(u))
+        return vizinhos
+    if hasattr(grafo, "vizinhos"):
+        # grafo implícito: basta vizinhos(no) -> [(viz, custo)]; antecessores(no) habilita a busca
+        # bidirecional e perfil_pesos() permite que a fila automática escolha baldes
+        return grafo.vizinhos
+    return lambda no: grafo.get(no, {}).items()
@@ -0,0 +1,168 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+import json
+import math
+import os
+import socketserver
+import threading
+
+from .cache import CacheArvores
+from .grafo_compacto import compilar
+from .lote import criar_algoritmo
+
+
+class ServicoConsultas:
+    def __init__(self, grafo, heuristica=None, algoritmo: str = "ucs", peso: Optional[float] = None,
+                 capacidade_cache: int = 128, usar_cache: bool = True):
+        criar_algoritmo(algoritmo, peso)
+        self.grafo = compilar(grafo)
+        self.heuristica = heuristica or {}
+        self.algoritmo = algoritmo
+        self.peso = peso
+        self.cache = CacheArvores(capacidade_cache) if usar_cache else None
+        self._local = threading.local()
+        self._trava = threading.Lock()
+        self.consultas = 0
+        self.erros = 0
+
+    def _instancia(self, nome: str, peso):
+        instancias = getattr(self._local, "instancias", None)
+        if instancias is None:
+            instancias = self._local.instancias = {}
+        algoritmo = instancias.get((nome, peso))
+        if algoritmo is None:
+            algoritmo = instancias[(nome, peso)] = criar_algoritmo(nome, peso)
+        return algoritmo
+
+    def responder(self, consulta: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(consulta, dict):
+            return self._erro({}, "Consulta inválida: a consulta deve ser um objeto JSON")
+        resposta: Dict[str, Any] = {"id": consulta["id"]} if "id" in consulta else {}
+        nome = consulta.get("algoritmo") or self.algoritmo
+        peso = consulta.get("peso", self.peso)
+        if "inicio" not in consulta or "objetivo" not in consulta:
+            return self._erro(resposta, "Consulta deve ter os campos 'inicio' e 'objetivo'.")
+        inicio, objetivo = str(consulta["inicio"]), str(consulta["objetivo"])
+        try:
+            for no in (inicio, objetivo):
+                self.grafo.id_de(no)
+            if nome == "ucs" and self.cache is not None:
+                caminho, custo, segundos = self.cache.resolver(self.grafo, inicio, objetivo)
+            else:
+                caminho, custo, segundos = self._instancia(nome, peso).resolver(
+                    self.grafo, inicio, objetivo, heuristica=self.heuristica)
+        except KeyError as e:
+            return self._erro(resposta, str(e.args[0]))
+        except (ValueError, TypeError) as e:
+            return self._erro(resposta, str(e))
+
+        with self._trava:
+            self.consultas += 1
+        resposta.update({
+            "inicio": inicio,
+            "objetivo": objetivo,
+            "algoritmo": nome,
+            "caminho": caminho,
+            "custo": custo if math.isfinite(custo) else None,
+            "segundos": segundos,
+        })
+        return resposta
+
+    def _erro(self, resposta: Dict[str, Any], mensagem: str) -> Dict[str, Any]:
+        with self._trava:
+            self.erros += 1
+        resposta["erro"] = mensagem
+        return resposta
+
+    def responder_linhas(self, linhas: Iterable[str]) -> Iterator[str]:
+        for linha in linhas:
+            linha = linha.strip()
+            if not linha:
+                continue
+            try:
+                consulta = json.loads(linha)
+            except ValueError as e:
+                yield json.dumps(self._erro({}, f"Consulta inválida: {e}"), ensure_ascii=False)
+                continue
+            yield json.dumps(self.responder(consulta), ensure_ascii=False)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        return {
+            "nos": self.grafo.num_nos,
+            "arestas": self.grafo.num_arestas,
+            "algoritmo": self.algoritmo,
+            "consultas": self.consultas,
+            "erros": self.erros,
+            "cache": self.cache.estatisticas() if self.cache is not None else None,
+        }
+
+
+class _ManipuladorHTTP(BaseHTTPRequestHandler):
+    servico: ServicoConsultas = None
+
+    def _enviar(self, status: int, corpo: str, tipo: str = "application/json"):
+        dados = corpo.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{tipo}; charset=utf-8")
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _enviar_json(self, status: int, objeto):
+        self._enviar(status, json.dumps(objeto, ensure_ascii=False))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/estatisticas":
+            self._enviar_json(200, self.servico.estatisticas())
+        elif url.path == "/consulta":
+            consulta = {k: v[0] for k, v in parse_qs(url.query).items()}
+            resposta = self.servico.responder(consulta)
+            self._enviar_json(400 if "erro" in resposta else 200, resposta)
+        else:
+            self._enviar_json(404, {"erro": f"Rota inexistente: {url.path}"})
+
+    def do_POST(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        corpo = self.rfile.read(tamanho).decode("utf-8")
+        try:
+            dados = json.loads(corpo)
+        except ValueError:
+            linhas = self.servico.responder_linhas(corpo.splitlines())
+            self._enviar(200, "".join(linha + "\n" for linha in linhas), "application/x-ndjson")
+            return
+        if isinstance(dados, list):
+            self._enviar_json(200, [self.servico.responder(c) for c in dados])
+        else:
+            resposta = self.servico.responder(dados)
+            self._enviar_json(400 if "erro" in resposta else 200, resposta)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+class _ManipuladorLinhas(socketserver.StreamRequestHandler):
+    servico: ServicoConsultas = None
+
+    def handle(self):
+        for bruta in self.rfile:
+            for resposta in self.servico.responder_linhas([bruta.decode("utf-8")]):
+                self.wfile.write((resposta + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+
+def criar_servidor_http(servico: ServicoConsultas, host: str = "127.0.0.1", porta: int = 8765) -> ThreadingHTTPServer:
+    manipulador = type("ManipuladorHTTP", (_ManipuladorHTTP,), {"servico": servico})
+    return ThreadingHTTPServer((host, porta), manipulador)
+
+
+def criar_servidor_unix(servico: ServicoConsultas, caminho: str):
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise RuntimeError("Sockets Unix não suportados nesta plataforma. Use o modo HTTP.")
+    if os.path.exists(caminho):
+        os.remove(caminho)
+    manipulador = type("ManipuladorLinhas", (_ManipuladorLinhas,), {"servico": servico})
+    servidor = socketserver.ThreadingUnixStreamServer(caminho, manipulador)
+    servidor.daemon_threads = True
+    return servidor
@@ -1,43 +1,155 @@
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 import heapq
 import time
 
-from .search_base import AlgoritmoBusca
+from .grafo_compacto import GrafoCompacto, arvore_compacta, buscar_compacto
+from .filas import criar_fila, escolher_fila
+from .observadores import trilha_de
+from .search_base import AlgoritmoBusca, funcao_vizinhos, reconstruir_caminho
+
+
+class ArvoreCaminhos:
+    def __init__(self, inicio: str, dist, pai, fechado=None, grafo: Optional[GrafoCompacto] = None,
+                 completa: bool = True):
+        self.inicio = inicio
+        self.dist = dist
+        self.pai = pai
+        self.fechado = fechado
+        self.grafo = grafo
+        self.completa = completa
+
+    def __contains__(self, no) -> bool:
+        if self.grafo is None:
+            return no in self.dist
+        i = self.grafo.indice.get(no)
+        return i is not None and bool(self.fechado[i])
+
+    def responde(self, no) -> bool:
+        return self.completa or no in self
+
+    def custo(self, no) -> float:
+        if no not in self:
+            if not self.completa:
+                raise KeyError(f"Nó fora da árvore parcial: {no}")
+            return float('inf')
+        if self.grafo is None:
+            return float(self.dist[no])
+        return float(self.dist[self.grafo.indice[no]])
+
+    def caminho(self, no) -> List[str]:
+        if no not in self:
+            if not self.completa:
+                raise KeyError(f"Nó fora da árvore parcial: {no}")
+            return []
+        if self.grafo is None:
+            return reconstruir_caminho(self.pai, no)
+        nomes, pai = self.grafo.nomes, self.pai
+        caminho = []
+        v = self.grafo.indice[no]
+        while v != -1:
+            caminho.append(nomes[v])
+            v = pai[v]
+        caminho.reverse()
+        return caminho
 
 
 class BuscaCustoUniforme(AlgoritmoBusca):
+    def __init__(self, fila: str = "auto", observador=None):
+        super().__init__(observador)
+        self.fila = fila
+
     def resolver(self, grafo: Dict[str, Dict[str, float]], inicio: str, objetivo: str, **kwargs):
-        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo)
+        caminho, custo, segundos, _ = self.resolver_com_trilha(grafo, inicio, objetivo, registrar_trilha=False)
         return caminho, custo, segundos
 
-    def resolver_com_trilha(self, grafo: Dict[str, Dict[str, float]], inicio: str, objetivo: str):
+    def arvore(self, grafo, inicio: str, objetivos: Iterable[str] = None) -> ArvoreCaminhos:
+        if isinstance(grafo, GrafoCompacto):
+            alvos = None
+            if objetivos is not None:
+                alvos = [grafo.indice[o] for o in objetivos if o in grafo.indice]
+            if inicio not in grafo.indice:
+                return ArvoreCaminhos(inicio, {}, {})
+            dist, pai, fechado, completa = arvore_compacta(grafo, grafo.indice[inicio], alvos)
+            return ArvoreCaminhos(inicio, dist, pai, fechado, grafo, completa=completa)
+
+        vizinhos = funcao_vizinhos(grafo)
+        restantes = set(objetivos) if objetivos is not None else None
+        fronteira: List[Tuple[float, str]] = [(0.0, inicio)]
+        melhor_custo = {inicio: 0.0}
+        pai = {inicio: None}
+        dist: Dict[str, float] = {}
+
+        while fronteira:
+            g, no = heapq.heappop(fronteira)
+            if no in dist:
+                continue
+            dist[no] = g
+            if restantes is not None:
+                restantes.discard(no)
+                if not restantes:
+                    break
+            for viz, passo in vizinhos(no):
+                g_novo = g + float(passo)
+                if viz not in melhor_custo or g_novo < melhor_custo[viz]:
+                    melhor_custo[viz] = g_novo
+                    pai[viz] = no
+                    heapq.heappush(fronteira, (g_novo, viz))
+
+        completa = objetivos is None or not fronteira
+        return ArvoreCaminhos(inicio, dist, pai, completa=completa)
+
+    def resolver_com_trilha(self, grafo: Dict[str, Dict[str, float]], inicio: str, objetivo: str,
+                            registrar_trilha: bool = True):
+        obs, registro = self._preparar_observador(registrar_trilha)
+        tipo_fila = escolher_fila(grafo, self.fila)
+        if isinstance(grafo, GrafoCompacto):
+            return buscar_compacto(grafo, inicio, objetivo, observador=obs, registro=registro, fila=tipo_fila)
+
         t0 = time.perf_counter()
-        fronteira: List[Tuple[float, str, List[str]]] = []
-        heapq.heappush(fronteira, (0.0, inicio, [inicio]))
+        vizinhos = funcao_vizinhos(grafo)
+        fronteira = criar_fila(tipo_fila, grafo)
+        inserir, remover = fronteira.inserir, fronteira.remover
+        inserir((0.0, 0.0, inicio))
 
         melhor_custo = {inicio: 0.0}
+        pai = {inicio: None}
         visitados = set()
+        if obs is not None:
+            obs.ao_iniciar(inicio, objetivo)
+            obs.ao_inserir(inicio, 0.0)
 
-        expandidos: List[str] = []
-        arestas_exploradas: List[Tuple[str, str]] = []
-
-        while fronteira:
-            g, no, caminho = heapq.heappop(fronteira)
+        while True:
+            try:
+                g, _, no = remover()
+            except IndexError:
+                break
+            if obs is not None:
+                obs.ao_remover(no, g)
             if no in visitados:
+                if obs is not None:
+                    obs.ao_descartar(no)
                 continue
             visitados.add(no)
-            expandidos.append(no)
+            if obs is not None:
+                obs.ao_expandir(no)
 
             if no == objetivo:
-                trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": caminho}
-                return caminho, float(g), float(time.perf_counter() - t0), trilha
+                caminho = reconstruir_caminho(pai, no)
+                if obs is not None:
+                    obs.ao_encontrar(no, g)
+                    obs.ao_terminar()
+                return caminho, float(g), float(time.perf_counter() - t0), trilha_de(registro, caminho)
 
-            for viz, passo in grafo.get(no, {}).items():
+            for viz, passo in vizinhos(no):
                 g_novo = g + float(passo)
                 if viz not in melhor_custo or g_novo < melhor_custo[viz]:
                     melhor_custo[viz] = g_novo
-                    heapq.heappush(fronteira, (g_novo, viz, caminho + [viz]))
-                    arestas_exploradas.append((no, viz))
+                    pai[viz] = no
+                    inserir((g_novo, g_novo, viz))
+                    if obs is not None:
+                        obs.ao_relaxar(no, viz, g_novo)
+                        obs.ao_inserir(viz, g_novo)
 
-        trilha = {"expandidos": expandidos, "arestas_exploradas": arestas_exploradas, "caminho_final": []}
-        return [], float('inf'), float(time.perf_counter() - t0), trilha
+        if obs is not None:
+            obs.ao_terminar()
+        return [], float('inf'), float(time.perf_counter() - t0), trilha_de(registro, [])
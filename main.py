@@ -1,4 +1,6 @@
 import math
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Dict, Any, List, Tuple
@@ -6,9 +8,14 @@ from typing import Dict, Any, List, Tuple
 from biblioteca.io_utils import carregar_com_heuristica
 from biblioteca.ucs import BuscaCustoUniforme
 from biblioteca.astar import BuscaAEstrela, BuscaAEstrelaPonderada, BuscaGulosa
+from biblioteca.heuristicas import HeuristicaCoordenadas
+from biblioteca.landmarks import carregar_ou_construir
+from biblioteca.layout import carregar_ou_calcular
+from biblioteca.observadores import BuscaCancelada, Contadores, ObservadorProgresso, ObservadoresMultiplos
+from biblioteca.bidirecional import BuscaBidirecionalCustoUniforme, BuscaBidirecionalAEstrela
 
 
-ALGOS = ["UCS (Dijkstra)", "A* (peso=1.0)", "A* Ponderado", "Gulosa"]
+ALGOS = ["UCS (Dijkstra)", "A* (peso=1.0)", "A* Ponderado", "Gulosa", "UCS Bidirecional", "A* Bidirecional"]
 
 
 class App(tk.Tk):
@@ -22,10 +29,26 @@ class App(tk.Tk):
         self.config_arq: Dict[str, Any] = {}
 
         self.pos: Dict[str, Tuple[float, float]] = {}
+        self.posicoes: Dict[str, Tuple[float, float]] = {}
         self.nos: List[str] = []
         self.arestas: List[Tuple[str, str, float]] = []
 
+        self.itens_no: Dict[str, Tuple[int, int]] = {}
+        self.itens_aresta: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self.zoom = 1.0
+        self._reposicionar_pendente = False
+
+        self._passos: List[tuple] = []
+        self._passo_i = 0
+        self._animacao_id = None
+        self._ao_terminar_animacao = None
+
+        self._mensagens: queue.Queue = queue.Queue()
+        self._ocupado = False
+        self._progresso = None
+
         self._build_ui()
+        self.after(50, self._processar_mensagens)
 
     def _build_ui(self):
         self.paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -72,6 +95,12 @@ class App(tk.Tk):
         self.ent_peso.pack(fill=tk.X, pady=(2, 4))
 
         ttk.Button(algo_frame, text="Rodar Busca", command=self._rodar).pack(fill=tk.X, pady=(4, 0))
+        ttk.Button(algo_frame, text="Cancelar", command=self._cancelar).pack(fill=tk.X, pady=(4, 0))
+
+        ttk.Label(algo_frame, text="Velocidade da animação:").pack(anchor=tk.W, pady=(6, 0))
+        self.vel_var = tk.IntVar(value=10)
+        ttk.Scale(algo_frame, from_=1, to=100, variable=self.vel_var, orient=tk.HORIZONTAL).pack(fill=tk.X)
+        ttk.Button(algo_frame, text="Pular para resultado", command=self._pular_animacao).pack(fill=tk.X, pady=(4, 0))
 
         info_frame = ttk.LabelFrame(self.controls_frame, text="Informações", padding=4)
         info_frame.pack(fill=tk.BOTH, expand=True)
@@ -85,7 +114,12 @@ class App(tk.Tk):
 
         self.canvas = tk.Canvas(self.canvas_frame, bg="white")
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
-        self.canvas.bind("<Configure>", lambda e: (self._layout(), self._desenhar()) if self.nos else None)
+        self.canvas.bind("<Configure>", lambda e: self._agendar_reposicionar())
+        self.canvas.bind("<MouseWheel>", lambda e: self._aplicar_zoom(1.2 if e.delta > 0 else 1 / 1.2))
+        self.canvas.bind("<Button-4>", lambda e: self._aplicar_zoom(1.2))
+        self.canvas.bind("<Button-5>", lambda e: self._aplicar_zoom(1 / 1.2))
+        self.canvas.bind("<ButtonPress-1>", lambda e: self.canvas.scan_mark(e.x, e.y))
+        self.canvas.bind("<B1-Motion>", lambda e: self.canvas.scan_dragto(e.x, e.y, gain=1))
 
         self.after(100, self._set_pane_sizes)
 
@@ -97,22 +131,68 @@ class App(tk.Tk):
 
     def _pick_file(self):
         path = filedialog.askopenfilename(
-            title="Escolha arquivo JSON/YAML do grafo",
-            filetypes=[("JSON/YAML", "*.json;*.jsn;*.yaml;*.yml"), ("Todos", "*.*")],
+            title="Escolha arquivo JSON/YAML/CSV do grafo",
+            filetypes=[("JSON/YAML", "*.json;*.jsn;*.yaml;*.yml"), ("Lista de arestas", "*.csv;*.ndjson;*.jsonl"),
+                       ("Todos", "*.*")],
             initialfile=self.arquivo_var.get() or ""
         )
         if path:
             self.arquivo_var.set(path)
 
-    def _carregar(self):
+    def _em_segundo_plano(self, tipo: str, funcao, *args):
+        self._ocupado = True
+
+        def trabalho():
+            try:
+                self._mensagens.put((tipo, funcao(*args)))
+            except BuscaCancelada:
+                self._mensagens.put(("cancelado", None))
+            except Exception as e:
+                self._mensagens.put(("erro_" + tipo, e))
+
+        threading.Thread(target=trabalho, daemon=True).start()
+
+    def _processar_mensagens(self):
         try:
-            grafo, heur, cfg = carregar_com_heuristica(self.arquivo_var.get())
-        except Exception as e:
-            messagebox.showerror("Erro ao carregar", str(e))
+            while True:
+                tipo, dados = self._mensagens.get_nowait()
+                if tipo == "progresso":
+                    expansoes, fronteira, melhor_f = dados
+                    self._set_info(f"Buscando... Expandidos: {expansoes} | Fronteira: {fronteira} | "
+                                   f"Melhor f: {melhor_f:.3f}")
+                    continue
+                self._ocupado = False
+                self._progresso = None
+                if tipo == "carga":
+                    self._concluir_carga(*dados)
+                elif tipo == "busca":
+                    self._concluir_busca(*dados)
+                elif tipo == "cancelado":
+                    self._set_info("Busca cancelada.")
+                elif tipo == "erro_carga":
+                    messagebox.showerror("Erro ao carregar", str(dados))
+                else:
+                    messagebox.showerror("Erro na busca", str(dados))
+        except queue.Empty:
+            pass
+        self.after(50, self._processar_mensagens)
+
+    def _cancelar(self):
+        if self._progresso is not None:
+            self._progresso.cancelar()
+            self._set_info("Cancelando...")
+
+    def _carregar(self):
+        if self._ocupado:
+            messagebox.showwarning("Aviso", "Aguarde a operação em andamento.")
             return
+        self._set_info("Carregando grafo...")
+        self._em_segundo_plano("carga", _ler_grafo, self.arquivo_var.get())
 
+    def _concluir_carga(self, grafo, heur, cfg, posicoes):
         self.grafo, self.heuristica, self.config_arq = grafo, heur, cfg
-        self.nos = sorted(self.grafo.keys())
+        self.posicoes = posicoes
+        self.nos = sorted(set(self.grafo.keys()) | {v for viz in self.grafo.values() for v in viz})
         self.arestas = [(u, v, float(c)) for u, viz in self.grafo.items() for v, c in viz.items()]
 
         self.cb_inicio["values"] = self.nos
@@ -121,43 +201,96 @@ class App(tk.Tk):
             self.inicio_var.set(self.nos[0])
             self.objetivo_var.set(self.nos[-1])
 
+        self._cancelar_animacao()
+        self.zoom = 1.0
         self._layout()
         self._desenhar()
         msg = "Grafo carregado. Selecione início/objetivo, algoritmo e peso (se A*)."
         if not self.heuristica:
             msg += " (Sem heurística: A* e Gulosa usarão h=0)"
+        elif isinstance(self.heuristica, HeuristicaCoordenadas):
+            msg += f" (Heurística {self.heuristica.metrica} pelas coordenadas do arquivo)"
+        elif not isinstance(self.heuristica, dict):
+            msg += f" (Sem heurística no arquivo: usando ALT com {len(self.heuristica.marcos)} marcos)"
         self._set_info(msg)
 
     def _layout(self):
         W = self.canvas.winfo_width() or 960
         H = self.canvas.winfo_height() or 560
         cx, cy = W/2, H/2
-        r = min(W, H) * 0.38
-        n = max(1, len(self.nos))
+        lado = min(W, H) * 0.76 * self.zoom
         self.pos = {}
-        for i, no in enumerate(self.nos):
-            ang = 2 * math.pi * i / n
-            x = cx + r * math.cos(ang)
-            y = cy + r * math.sin(ang)
-            self.pos[no] = (x, y)
+        for no in self.nos:
+            nx, ny = self.posicoes.get(no, (0.5, 0.5))
+            self.pos[no] = (cx + (nx - 0.5) * lado, cy + (ny - 0.5) * lado)
+
+    def _raio_no(self) -> float:
+        return 18 * self.zoom * min(1.0, math.sqrt(60 / max(1, len(self.nos))))
 
     def _desenhar(self):
         self.canvas.delete("all")
+        self.itens_no.clear()
+        self.itens_aresta.clear()
         for u, v, c in self.arestas:
             x1, y1 = self.pos[u]
             x2, y2 = self.pos[v]
-            self.canvas.create_line(x1, y1, x2, y2, fill="#999", width=2, tags=("aresta", f"{u}->{v}"))
+            linha = self.canvas.create_line(x1, y1, x2, y2, fill="#999", width=2, tags=("aresta",))
             mx, my = (x1 + x2) / 2, (y1 + y2) / 2
             texto = str(int(c) if float(c).is_integer() else f"{c:.1f}")
-            self.canvas.create_text(mx, my, text=texto, fill="#444", font=("Arial", 9))
+            rotulo = self.canvas.create_text(mx, my, text=texto, fill="#444", font=("Arial", 9),
+                                             tags=("rotulo_aresta",))
+            self.itens_aresta[(u, v)] = (linha, rotulo)
 
-        R = 18
+        R = self._raio_no()
         for no in self.nos:
             x, y = self.pos[no]
-            self.canvas.create_oval(x - R, y - R, x + R, y + R,
-                                    fill="#f7f7ff", outline="#333", width=2,
-                                    tags=("no", no))
-            self.canvas.create_text(x, y, text=no, font=("Arial", 10, "bold"), fill="#222")
+            oval = self.canvas.create_oval(x - R, y - R, x + R, y + R,
+                                           fill="#f7f7ff", outline="#333", width=2,
+                                           tags=("no",))
+            texto = self.canvas.create_text(x, y, text=no, font=("Arial", 10, "bold"), fill="#222",
+                                            tags=("rotulo_no",))
+            self.itens_no[no] = (oval, texto)
+        self._aplicar_detalhe()
+
+    def _agendar_reposicionar(self):
+        if not self.nos or self._reposicionar_pendente:
+            return
+        self._reposicionar_pendente = True
+        self.after(30, self._reposicionar)
+
+    def _reposicionar(self):
+        self._reposicionar_pendente = False
+        self._layout()
+        coords = self.canvas.coords
+        pos = self.pos
+        for (u, v), (linha, rotulo) in self.itens_aresta.items():
+            x1, y1 = pos[u]
+            x2, y2 = pos[v]
+            coords(linha, x1, y1, x2, y2)
+            coords(rotulo, (x1 + x2) / 2, (y1 + y2) / 2)
+        R = self._raio_no()
+        for no, (oval, texto) in self.itens_no.items():
+            x, y = pos[no]
+            coords(oval, x - R, y - R, x + R, y + R)
+            coords(texto, x, y)
+        self._aplicar_detalhe()
+
+    def _aplicar_zoom(self, fator: float):
+        if not self.nos:
+            return
+        self.zoom = min(20.0, max(0.2, self.zoom * fator))
+        self._reposicionar()
+
+    def _aplicar_detalhe(self):
+        R = self._raio_no()
+        mostrar_rotulos = R >= 10 and len(self.arestas) * self.zoom <= 4000
+        self.canvas.itemconfigure("rotulo_aresta", state=tk.NORMAL if mostrar_rotulos else tk.HIDDEN)
+        self.canvas.itemconfigure("rotulo_no", state=tk.NORMAL if R >= 10 else tk.HIDDEN)
+        self.canvas.itemconfigure("no", state=tk.NORMAL if R >= 2 else tk.HIDDEN)
+
+    def _resetar_cores(self):
+        self.canvas.itemconfigure("no", fill="#f7f7ff", outline="#333", width=2)
+        self.canvas.itemconfigure("aresta", fill="#999", width=2)
 
     def _set_info(self, msg: str):
         self.lbl_info.configure(text=msg)
@@ -181,46 +314,59 @@ class App(tk.Tk):
             messagebox.showwarning("Peso inválido", "Informe um valor numérico > 0 para o peso do A*.")
             return
 
-        if algo_nome.startswith("UCS"):
-            algoritmo = BuscaCustoUniforme()
-            caminho, custo, segundos, trilha = algoritmo.resolver_com_trilha(self.grafo, inicio, objetivo)
+        if self._ocupado:
+            messagebox.showwarning("Aviso", "Aguarde a operação em andamento.")
+            return
+
+        contadores = Contadores()
+        self._progresso = ObservadorProgresso(
+            lambda *dados: self._mensagens.put(("progresso", dados)), intervalo=500)
+        observador = ObservadoresMultiplos(contadores, self._progresso)
+        if algo_nome.startswith("UCS Bidirecional"):
+            algoritmo = BuscaBidirecionalCustoUniforme(observador=observador)
+            args = (self.grafo, inicio, objetivo)
+
+        elif algo_nome.startswith("A* Bidirecional"):
+            algoritmo = BuscaBidirecionalAEstrela(observador=observador)
+            args = (self.grafo, inicio, objetivo, self.heuristica)
+
+        elif algo_nome.startswith("UCS"):
+            algoritmo = BuscaCustoUniforme(observador=observador)
+            args = (self.grafo, inicio, objetivo)
 
         elif algo_nome.startswith("A* (peso=1.0)"):
-            algoritmo = BuscaAEstrela(peso=1.0)
-            caminho, custo, segundos, trilha = algoritmo.resolver_com_trilha(
-                self.grafo, inicio, objetivo, self.heuristica, 1.0
-            )
+            algoritmo = BuscaAEstrela(peso=1.0, observador=observador)
+            args = (self.grafo, inicio, objetivo, self.heuristica, 1.0)
 
         elif algo_nome.startswith("A* Ponderado"):
-            algoritmo = BuscaAEstrelaPonderada(peso=peso)
-            caminho, custo, segundos, trilha = algoritmo.resolver_com_trilha(
-                self.grafo, inicio, objetivo, self.heuristica, peso
-            )
+            algoritmo = BuscaAEstrelaPonderada(peso=peso, observador=observador)
+            args = (self.grafo, inicio, objetivo, self.heuristica, peso)
 
         else:  # Gulosa
-            algoritmo = BuscaGulosa()
-            caminho, custo, segundos, trilha = algoritmo.resolver_com_trilha(
-                self.grafo, inicio, objetivo, self.heuristica
-            )
+            algoritmo = BuscaGulosa(observador=observador)
+            args = (self.grafo, inicio, objetivo, self.heuristica)
 
-        self._desenhar()
-        self.update()
+        def buscar():
+            return (algo_nome, *algoritmo.resolver_com_trilha(*args), contadores)
 
-        for no in trilha.get("expandidos", []):
-            self._pintar_no(no, fill="#cfe9ff")
-            self.update()
-            self.after(150)
+        self._cancelar_animacao()
+        self._set_info(f"Buscando com {algo_nome}...")
+        self._em_segundo_plano("busca", buscar)
 
-        for (u, v) in trilha.get("arestas_exploradas", []):
-            self._pintar_aresta(u, v, color="#66a3ff", width=3)
-            self.update()
-            self.after(120)
+    def _concluir_busca(self, algo_nome, caminho, custo, segundos, trilha, contadores):
+        self._cancelar_animacao()
+        self._resetar_cores()
+        passos = [("no", no) for no in trilha.get("expandidos", [])]
+        passos += [("aresta", u, v) for (u, v) in trilha.get("arestas_exploradas", [])]
+        self._iniciar_animacao(passos, lambda: self._mostrar_resultado(
+            algo_nome, caminho, custo, segundos, trilha, contadores))
 
+    def _mostrar_resultado(self, algo_nome, caminho, custo, segundos, trilha, contadores):
         caminho = caminho or []
         melhores = set()
         for i in range(len(caminho) - 1):
             melhores.add((caminho[i], caminho[i + 1]))
-            melhores.add((caminho[i + 1], caminho[i])) 
+            melhores.add((caminho[i + 1], caminho[i]))
         descartadas = []
         for (u, v) in trilha.get("arestas_exploradas", []):
             if (u, v) not in melhores and (v, u) not in melhores:
@@ -240,27 +386,98 @@ class App(tk.Tk):
             self._set_info(
                 f"Algoritmo: {algo_nome} | Caminho: {' -> '.join(caminho)} | "
                 f"Custo: {custo:.3f} | Tempo (s): {segundos:.6f} | "
-                f"Expandidos: {n_exp} | Exploradas: {n_expl} | Descartadas: {n_desc}"
+                f"Expandidos: {n_exp} | Exploradas: {n_expl} | Descartadas: {n_desc} | "
+                f"Inserções: {contadores.insercoes} | Entradas obsoletas: {contadores.descartes} | "
+                f"Fronteira máx: {contadores.fronteira_max}"
             )
         else:
             self._set_info(f"Algoritmo: {algo_nome} | Sem caminho. Tempo (s): {segundos:.6f}")
 
+    def _iniciar_animacao(self, passos: List[tuple], ao_terminar):
+        self._passos = passos
+        self._passo_i = 0
+        self._ao_terminar_animacao = ao_terminar
+        self._agendar_passo()
+
+    def _agendar_passo(self):
+        vel = max(1, int(self.vel_var.get()))
+        self._animacao_id = self.after(max(1, int(300 / vel)), self._executar_passos)
+
+    def _executar_passos(self):
+        self._animacao_id = None
+        vel = max(1, int(self.vel_var.get()))
+        fim = min(len(self._passos), self._passo_i + 1 + vel // 10)
+        self._aplicar_passos(self._passo_i, fim)
+        self._passo_i = fim
+        if self._passo_i >= len(self._passos):
+            self._concluir_animacao()
+        else:
+            self._agendar_passo()
+
+    def _aplicar_passos(self, ini: int, fim: int):
+        for passo in self._passos[ini:fim]:
+            if passo[0] == "no":
+                self._pintar_no(passo[1], fill="#cfe9ff")
+            else:
+                self._pintar_aresta(passo[1], passo[2], color="#66a3ff", width=3)
+
+    def _pular_animacao(self):
+        if self._ao_terminar_animacao is None:
+            return
+        if self._animacao_id is not None:
+            self.after_cancel(self._animacao_id)
+            self._animacao_id = None
+        self._aplicar_passos(self._passo_i, len(self._passos))
+        self._passo_i = len(self._passos)
+        self._concluir_animacao()
+
+    def _concluir_animacao(self):
+        ao_terminar = self._ao_terminar_animacao
+        self._ao_terminar_animacao = None
+        self._passos = []
+        if ao_terminar is not None:
+            ao_terminar()
+
+    def _cancelar_animacao(self):
+        if self._animacao_id is not None:
+            self.after_cancel(self._animacao_id)
+            self._animacao_id = None
+        self._passos = []
+        self._ao_terminar_animacao = None
+
     def _pintar_aresta(self, u: str, v: str, color="#66a3ff", width=3):
-        tag = f"{u}->{v}"
-        for item in self.canvas.find_withtag(tag):
-            self.canvas.itemconfigure(item, fill=color, width=width)
-        tag2 = f"{v}->{u}"
-        for item in self.canvas.find_withtag(tag2):
-            self.canvas.itemconfigure(item, fill=color, width=width)
+        for par in ((u, v), (v, u)):
+            itens = self.itens_aresta.get(par)
+            if itens is not None:
+                self.canvas.itemconfigure(itens[0], fill=color, width=width)
 
     def _pintar_no(self, no: str, fill=None, outline=None, width=None):
-        for item in self.canvas.find_withtag(no):
-            if fill is not None:
-                self.canvas.itemconfigure(item, fill=fill)
-            if outline is not None:
-                self.canvas.itemconfigure(item, outline=outline)
-            if width is not None:
-                self.canvas.itemconfigure(item, width=width)
+        itens = self.itens_no.get(no)
+        if itens is None:
+            return
+        opcoes = {}
+        if fill is not None:
+            opcoes["fill"] = fill
+        if outline is not None:
+            opcoes["outline"] = outline
+        if width is not None:
+            opcoes["width"] = width
+        if opcoes:
+            self.canvas.itemconfigure(itens[0], **opcoes)
+
+
+def _ler_grafo(arquivo: str):
+    grafo, heur, cfg = carregar_com_heuristica(arquivo)
+    if not heur and grafo:
+        try:
+            heur = carregar_ou_construir(arquivo, grafo)
+        except Exception:
+            heur = {}
+    try:
+        posicoes = carregar_ou_calcular(arquivo, grafo, cfg)
+    except Exception:
+        posicoes = {}
+    return grafo, heur, cfg, posicoes
 
 
 if __name__ == "__main__":